@@ -1,6 +1,26 @@
+from typing import List, Sequence
 from chimera.core.models import TaskResult, Verdict
 from pydantic import BaseModel
 
+# Confidence thresholds (Management by Exception)
+APPROVE_THRESHOLD = 0.9
+ESCALATE_THRESHOLD = 0.7
+
+# Reason attached to each confidence-based verdict
+_VERDICT_REASONS = {
+    Verdict.APPROVE: "High confidence",
+    Verdict.ESCALATE: "Medium confidence, needs review",
+    Verdict.REJECT: "Low confidence",
+}
+
+def _verdict_for(confidence: float) -> Verdict:
+    """Maps a confidence score to a verdict using the thresholds above."""
+    if confidence >= APPROVE_THRESHOLD:
+        return Verdict.APPROVE
+    if confidence >= ESCALATE_THRESHOLD:
+        return Verdict.ESCALATE
+    return Verdict.REJECT
+
 class JudgeDecision(BaseModel):
     verdict: Verdict
     reason: str = ""
@@ -19,9 +39,15 @@ class JudgeAgent:
             return JudgeDecision(verdict=Verdict.REJECT, reason="Task failed execution")
             
         # Confidence logic (Management by Exception)
-        if result.confidence_score >= 0.9:
-            return JudgeDecision(verdict=Verdict.APPROVE, reason="High confidence")
-        elif result.confidence_score >= 0.7:
-            return JudgeDecision(verdict=Verdict.ESCALATE, reason="Medium confidence, needs review")
-        else:
-            return JudgeDecision(verdict=Verdict.REJECT, reason="Low confidence")
+        verdict = _verdict_for(result.confidence_score)
+        return JudgeDecision(verdict=verdict, reason=_VERDICT_REASONS[verdict])
+
+    def evaluate_batch(self, confidences: Sequence[float]) -> List[Verdict]:
+        """
+        Maps many confidence scores to verdicts in one pass.
+        
+        Applies the same thresholds as evaluate() without building a
+        TaskResult or JudgeDecision per score; failed results must still
+        go through evaluate().
+        """
+        return [_verdict_for(c) for c in confidences]
@@ -1,7 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import os
 from pydantic import BaseModel, Field
 from chimera.core.models import Task, TaskResult
-from chimera.mcp.client import SkillExecutor
+from chimera.mcp.client import SkillExecutor, SkillExecutorPool
 from chimera.core.llm import LLMClient
 import uuid
 
@@ -17,9 +18,18 @@ class WorkerAgent:
     Stateless and ephemeral.
     Uses LLM to dynamically select and execute tools.
     """
-    def __init__(self, worker_id: str = None, server_script_path: str = None):
+    def __init__(
+        self,
+        worker_id: str = None,
+        server_script_path: str = None,
+        skill_executor: Optional[SkillExecutor] = None
+    ):
         self.worker_id = worker_id or str(uuid.uuid4())
-        if server_script_path:
+        # A shared executor (e.g. from WorkerPool) outlives the task; an owned one is torn down after it
+        self._owns_executor = skill_executor is None
+        if skill_executor is not None:
+            self.skill_executor = skill_executor
+        elif server_script_path:
             self.skill_executor = SkillExecutor(server_script_path=server_script_path)
         else:
             self.skill_executor = SkillExecutor()
@@ -100,7 +110,39 @@ class WorkerAgent:
                 status="failed"
             )
         finally:
-            try:
-                await self.skill_executor.cleanup()
-            except Exception:
-                pass
+            if self._owns_executor:
+                try:
+                    await self.skill_executor.cleanup()
+                except Exception:
+                    pass
+
+
+class WorkerPool:
+    """
+    Hands out WorkerAgents that share one long-lived MCP session per server script.
+    
+    Each worker keeps its own identity and LLM context, but tool calls are
+    multiplexed over the pooled session instead of spawning (and importing)
+    a fresh server process per task. Sessions come from SkillExecutorPool,
+    whose owner tasks open and close them, so aclose() may run in any task
+    on the same event loop. It only shuts down the sessions this pool
+    started, leaving ones other components (e.g. the planner) already had
+    open.
+    """
+    
+    def __init__(self):
+        self._started: Dict[str, SkillExecutor] = {}
+    
+    async def get(self, server_script_path: str, worker_id: str = None) -> WorkerAgent:
+        """Returns a new worker bound to the shared session for the given server."""
+        existing = SkillExecutorPool.running(server_script_path)
+        executor = await SkillExecutorPool.get(server_script_path)
+        if executor is not existing:
+            self._started[os.path.abspath(server_script_path)] = executor
+        return WorkerAgent(worker_id=worker_id, skill_executor=executor)
+    
+    async def aclose(self):
+        """Shuts down the server sessions this pool started."""
+        started, self._started = self._started, {}
+        for path, executor in started.items():
+            await SkillExecutorPool.close(path, executor)
@@ -3,7 +3,7 @@ Weaviate Memory Integration for Hierarchical Memory Retrieval.
 
 Implements FR 1.1: Hierarchical Memory Retrieval using RAG pipeline.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import weaviate
 from weaviate.classes.config import Configure, Property, DataType
 from datetime import datetime
@@ -13,6 +13,9 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Long-term section placeholder in assemble_context(); also what a failed search yields
+NO_LONG_TERM_MEMORIES = "(No relevant past memories found)"
+
 
 class Memory(BaseModel):
     """Represents a single memory entry in Weaviate."""
@@ -193,9 +196,38 @@ class MemoryManager:
         Returns:
             List of relevant Memory objects
         """
+        return list(self.search_memories_iter(
+            query, agent_id, limit=limit, memory_type=memory_type, min_importance=min_importance
+        ))
+    
+    def search_memories_iter(
+        self,
+        query: str,
+        agent_id: str,
+        limit: int = 5,
+        memory_type: Optional[str] = None,
+        min_importance: float = 0.0
+    ) -> Iterator[Memory]:
+        """
+        Like search_memories, but yields Memory objects one at a time.
+        
+        Each result is converted only when the caller asks for it, so callers
+        that stop early or format results as they go never hold a second,
+        fully converted copy of the result set.
+        
+        Args:
+            query: Search query (will be vectorized and matched)
+            agent_id: Filter memories by agent ID
+            limit: Maximum number of results
+            memory_type: Filter by memory type (optional)
+            min_importance: Minimum importance score threshold
+            
+        Yields:
+            Relevant Memory objects, most relevant first
+        """
         if not self.client:
             logger.warning("Weaviate client not available. Returning empty results.")
-            return []
+            return
         
         try:
             collection = self.client.collections.get("AgentMemory")
@@ -217,26 +249,27 @@ class MemoryManager:
                 where=where_filter,
                 return_metadata=["distance", "certainty"]
             )
-            
-            memories = []
-            for obj in result.objects:
-                props = obj.properties
-                # Filter by importance if needed
-                importance = props.get("importance_score", 0.0)
-                if importance >= min_importance:
-                    memories.append(Memory(
-                        content=props["content"],
-                        agent_id=props["agent_id"],
-                        timestamp=datetime.fromisoformat(props["timestamp"]),
-                        importance_score=importance,
-                        memory_type=props.get("memory_type", "episodic"),
-                        metadata={k.replace("metadata_", ""): v for k, v in props.items() if k.startswith("metadata_")}
-                    ))
-            
-            return memories
         except Exception as e:
             logger.error(f"Failed to search memories: {e}")
-            return []
+            return
+        
+        for obj in result.objects:
+            props = obj.properties
+            # Filter by importance if needed
+            importance = props.get("importance_score", 0.0)
+            if importance < min_importance:
+                continue
+            try:
+                yield Memory(
+                    content=props["content"],
+                    agent_id=props["agent_id"],
+                    timestamp=datetime.fromisoformat(props["timestamp"]),
+                    importance_score=importance,
+                    memory_type=props.get("memory_type", "episodic"),
+                    metadata={k.replace("metadata_", ""): v for k, v in props.items() if k.startswith("metadata_")}
+                )
+            except Exception as e:
+                logger.error(f"Skipping malformed memory: {e}")
     
     def assemble_context(
         self,
@@ -286,6 +319,6 @@ class MemoryManager:
                     f"{memory.content[:200]}..."
                 )
         else:
-            sections.append("(No relevant past memories found)")
+            sections.append(NO_LONG_TERM_MEMORIES)
         
         return "\n".join(sections)
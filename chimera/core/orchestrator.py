@@ -124,11 +124,11 @@ class Orchestrator:
         
         while self._running:
             try:
-                # Get current state
-                state = self.state_manager.get_state_snapshot()
+                # Get current state (read-only view, no copy needed)
+                state = self.state_manager.get_state_readonly()
                 
                 # Check for active campaigns
-                for campaign_id, campaign_data in state.active_campaigns.items():
+                for campaign_id, campaign_data in state["active_campaigns"].items():
                     if campaign_data.get("status") == "active":
                         goal = campaign_data.get("goal_description", "")
                         
@@ -3,8 +3,10 @@ Perception System: Data Ingestion and Semantic Filtering.
 
 Implements FR 2.0, FR 2.1, FR 2.2: Active Resource Monitoring, Semantic Filtering, and Trend Detection.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from collections import Counter
 import datetime
+import functools
 import random
 import logging
 
@@ -18,14 +20,17 @@ class SemanticFilter:
     Implements FR 2.1: Content must exceed Relevance Threshold (0.75) to trigger tasks.
     """
     
-    def __init__(self, relevance_threshold: float = 0.75):
+    def __init__(self, relevance_threshold: float = 0.75, cache_size: int = 4096):
         """
         Initialize semantic filter.
         
         Args:
             relevance_threshold: Minimum relevance score (0.0 to 1.0) to pass filter
+            cache_size: Maximum number of (content, goals) scores kept per filter
         """
         self.relevance_threshold = relevance_threshold
+        # Per-instance LRU, so a filter's cache is released with the filter
+        self._score_cached = functools.lru_cache(maxsize=cache_size)(self._score)
     
     def score_relevance(
         self,
@@ -47,6 +52,15 @@ class SemanticFilter:
         Returns:
             Relevance score (0.0 to 1.0)
         """
+        # Scoring is the expensive step (an LLM call in production), so repeated
+        # (content, goals) pairs are served from cache and score consistently.
+        # Context is not part of the key, so calls with context bypass it.
+        if context is not None:
+            return self._score(content, tuple(agent_goals))
+        return self._score_cached(content, tuple(agent_goals))
+    
+    def _score(self, content: str, agent_goals: Tuple[str, ...]) -> float:
+        """Computes a relevance score without consulting the cache."""
         content_lower = content.lower()
         goal_keywords = []
         
@@ -141,6 +155,51 @@ class TrendDetector:
                 })
         
         return trends
+    
+    def analyze_trends_vec(
+        self,
+        topics: Sequence[str],
+        volumes: Sequence[int],
+        sentiment_scores: Sequence[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Column-oriented variant of analyze_trends for large batches.
+        
+        Takes one sequence per field (index i across all three is one data
+        point) and aggregates them in a single pass, without building
+        per-row dicts or per-topic item lists.
+        
+        Args:
+            topics: Topic of each data point
+            volumes: Volume of each data point
+            sentiment_scores: Sentiment score of each data point
+            
+        Returns:
+            List of detected trends, in the same shape as analyze_trends
+        """
+        counts = Counter(topics)
+        clustered = {topic for topic, count in counts.items() if count >= 3}
+        if not clustered:
+            return []
+        
+        volume_totals: Dict[str, int] = dict.fromkeys(clustered, 0)
+        sentiment_totals: Dict[str, float] = dict.fromkeys(clustered, 0.0)
+        for topic, volume, sentiment in zip(topics, volumes, sentiment_scores):
+            if topic in clustered:
+                volume_totals[topic] += volume
+                sentiment_totals[topic] += sentiment
+        
+        detected_at = datetime.datetime.now().isoformat()
+        return [
+            {
+                "topic": topic,
+                "cluster_size": counts[topic],
+                "avg_sentiment": sentiment_totals[topic] / counts[topic],
+                "total_volume": volume_totals[topic],
+                "detected_at": detected_at
+            }
+            for topic in counts if topic in clustered
+        ]
 
 
 def fetch_trends(topic: str) -> List[Dict[str, Any]]:
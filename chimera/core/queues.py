@@ -4,7 +4,6 @@ Redis-based Queue Infrastructure for the Chimera Swarm.
 Implements TaskQueue (Planner -> Worker) and ReviewQueue (Worker -> Judge).
 """
 from typing import Optional
-import json
 try:
     import redis.asyncio as redis
 except ImportError:
@@ -100,8 +99,7 @@ class QueueManager:
             return None
         
         _, task_json = result
-        task_dict = json.loads(task_json)
-        return Task(**task_dict)
+        return Task.model_validate_json(task_json)
     
     async def get_task_count(self) -> int:
         """Returns the number of pending tasks."""
@@ -148,8 +146,7 @@ class QueueManager:
             return None
         
         _, result_json = result
-        result_dict = json.loads(result_json)
-        return TaskResult(**result_dict)
+        return TaskResult.model_validate_json(result_json)
     
     async def get_review_count(self) -> int:
         """Returns the number of pending reviews."""
@@ -4,11 +4,12 @@ GlobalState Management with Optimistic Concurrency Control (OCC).
 This module implements the centralized state management for the Chimera swarm,
 ensuring consistency across Planner, Worker, and Judge agents.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
+from types import MappingProxyType
 import hashlib
-import json
+import orjson
 from enum import Enum
 
 
@@ -49,32 +50,85 @@ class GlobalState(BaseModel):
     # Version Control
     state_version: StateVersion = Field(...)
     
-    def compute_hash(self) -> str:
-        """Computes a deterministic hash of the state (excluding version)."""
+    def serialize(self) -> bytes:
+        """Serializes the state deterministically (excluding version)."""
         # Create a dict without the version field for hashing
         state_dict = self.model_dump(exclude={"state_version"})
-        state_json = json.dumps(state_dict, sort_keys=True, default=str)
-        return hashlib.sha256(state_json.encode()).hexdigest()
+        return orjson.dumps(
+            state_dict,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    
+    def compute_hash(self) -> str:
+        """Computes a deterministic hash of the state (excluding version)."""
+        return hashlib.sha256(self.serialize()).hexdigest()
     
-    def update_version(self, updated_by: str) -> None:
-        """Updates the state version after a modification."""
-        new_hash = self.compute_hash()
+    def update_version(self, updated_by: str, version_hash: Optional[str] = None) -> None:
+        """
+        Updates the state version after a modification.
+        
+        Args:
+            updated_by: Agent ID making the change
+            version_hash: Precomputed hash of the current contents (computed if omitted)
+        """
         self.state_version = StateVersion(
-            version_hash=new_hash,
+            version_hash=version_hash or self.compute_hash(),
             updated_by=updated_by,
             timestamp=datetime.now()
         )
 
 
+# Redis hashes holding budget tracking when StateManager is Redis-backed
+BUDGET_SPEND_KEY = "chimera:daily_spend"    # currency -> amount spent
+BUDGET_LIMITS_KEY = "chimera:budget_limits"  # currency -> daily limit
+
+# Atomically applies a spend unless it would exceed the currency's limit.
+# KEYS: spend hash, limits hash. ARGV: currency, amount. Returns 1 if applied.
+UPDATE_BUDGET_LUA = """
+local spend = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+local limit = redis.call('HGET', KEYS[2], ARGV[1])
+if limit and spend + tonumber(ARGV[2]) > tonumber(limit) then
+    return 0
+end
+redis.call('HINCRBYFLOAT', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively converts dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class StateManager:
     """
     Manages GlobalState with OCC validation.
     
     This is the single source of truth for the Chimera network.
     All state modifications must go through this manager.
+    
+    Budget tracking can optionally live in Redis: pass a (sync) redis client
+    and spend updates become a single atomic server-side script call instead
+    of a snapshot/commit OCC cycle. In that mode spend and limits are read
+    from Redis only; set limits with set_budget_limit().
     """
     
-    def __init__(self):
+    def __init__(self, redis_client: Optional[Any] = None):
+        """
+        Initialize StateManager.
+        
+        Args:
+            redis_client: Redis client for budget tracking (optional)
+        """
+        self._redis = redis_client
+        self._update_budget_script = (
+            redis_client.register_script(UPDATE_BUDGET_LUA) if redis_client else None
+        )
         self._state = GlobalState(
             state_version=StateVersion(
                 version_hash="initial",
@@ -83,6 +137,8 @@ class StateManager:
             )
         )
         self._state.update_version("system")
+        # Frozen view of _state for get_state_readonly(), rebuilt after each commit
+        self._readonly_view: Optional[Mapping[str, Any]] = None
     
     def get_state_snapshot(self) -> GlobalState:
         """
@@ -94,6 +150,20 @@ class StateManager:
         # Return a deep copy to prevent direct mutation
         return self._state.model_copy(deep=True)
     
+    def get_state_readonly(self) -> Mapping[str, Any]:
+        """
+        Returns a read-only view of the current state.
+        
+        The view is a MappingProxyType keyed by GlobalState field name, with
+        every nested dict frozen too, so callers cannot corrupt shared state.
+        It is built once per committed version and shared by all readers, and
+        a held view is unaffected by later commits. Use get_state_snapshot()
+        for any read-modify-commit cycle.
+        """
+        if self._readonly_view is None:
+            self._readonly_view = _freeze(self._state.model_dump())
+        return self._readonly_view
+    
     def commit_state_change(
         self,
         modified_state: GlobalState,
@@ -121,12 +191,13 @@ class StateManager:
             # State has changed - OCC conflict detected
             return False
         
-        # Validate the modified state
+        # Validate the modified state (serialized once, reused for the version)
         new_hash = modified_state.compute_hash()
         
         # Update state and version
         self._state = modified_state
-        self._state.update_version(agent_id)
+        self._state.update_version(agent_id, new_hash)
+        self._readonly_view = None
         
         return True
     
@@ -144,7 +215,19 @@ class StateManager:
         return self.commit_state_change(snapshot, agent_id, expected_hash)
     
     def update_budget(self, currency: str, amount: float, agent_id: str) -> bool:
-        """Updates daily spend tracking."""
+        """
+        Updates daily spend tracking.
+        
+        When Redis-backed, the increment and limit check run atomically on the
+        server; returns False if the spend would exceed the limit.
+        """
+        if self._update_budget_script is not None:
+            applied = self._update_budget_script(
+                keys=[BUDGET_SPEND_KEY, BUDGET_LIMITS_KEY],
+                args=[currency, amount]
+            )
+            return bool(applied)
+        
         snapshot = self.get_state_snapshot()
         expected_hash = snapshot.state_version.version_hash
         
@@ -152,6 +235,24 @@ class StateManager:
         
         return self.commit_state_change(snapshot, agent_id, expected_hash)
     
+    def set_budget_limit(self, currency: str, limit: float, agent_id: str) -> bool:
+        """
+        Sets the daily spend limit for a currency.
+        
+        When Redis-backed, the limit is written to Redis, where the atomic
+        update script enforces it; otherwise it is committed to GlobalState.
+        """
+        if self._redis is not None:
+            self._redis.hset(BUDGET_LIMITS_KEY, currency, limit)
+            return True
+        
+        snapshot = self.get_state_snapshot()
+        expected_hash = snapshot.state_version.version_hash
+        
+        snapshot.budget_limits[currency] = limit
+        
+        return self.commit_state_change(snapshot, agent_id, expected_hash)
+    
     def check_budget_limit(self, currency: str, requested_amount: float) -> tuple[bool, float]:
         """
         Checks if a transaction would exceed budget limits.
@@ -159,8 +260,14 @@ class StateManager:
         Returns:
             (is_allowed, current_spend)
         """
-        current_spend = self._state.daily_spend.get(currency, 0.0)
-        limit = self._state.budget_limits.get(currency, float('inf'))
+        if self._redis is not None:
+            spend = self._redis.hget(BUDGET_SPEND_KEY, currency)
+            raw_limit = self._redis.hget(BUDGET_LIMITS_KEY, currency)
+            current_spend = float(spend or 0.0)
+            limit = float(raw_limit) if raw_limit is not None else float('inf')
+        else:
+            current_spend = self._state.daily_spend.get(currency, 0.0)
+            limit = self._state.budget_limits.get(currency, float('inf'))
         
         if current_spend + requested_amount > limit:
             return False, current_spend
@@ -4,11 +4,21 @@ Character Consistency Validation for Image Generation.
 Implements FR 3.1: Character Consistency Lock - ensures virtual influencer
 remains recognizable across thousands of posts.
 """
-from typing import Optional
+from typing import Any, Optional
+import hashlib
 import logging
+from chimera.core.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Process-wide memo of comparison results (cache_key -> is_match), LRU-evicted.
+# Entries expire on the same schedule as the Redis tier.
+RESULT_CACHE_MAXSIZE = 10000
+RESULT_CACHE_TTL_SECONDS = 86400
+_result_cache: LRUCache[str, bool] = LRUCache(
+    maxsize=RESULT_CACHE_MAXSIZE, ttl=RESULT_CACHE_TTL_SECONDS
+)
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -22,14 +32,16 @@ class CharacterConsistencyValidator:
     Uses Vision-capable LLM (Gemini 3 Pro Vision or GPT-4o) to compare images.
     """
     
-    def __init__(self, vision_model: Optional[str] = None):
+    def __init__(self, vision_model: Optional[str] = None, redis_client: Optional[Any] = None):
         """
         Initialize validator.
         
         Args:
             vision_model: Vision model to use ("gemini" or "gpt4o")
+            redis_client: Async Redis client used to persist results across restarts (optional)
         """
         self.vision_model = vision_model or "gemini"
+        self.redis_client = redis_client
         # In production, would initialize vision API client here
     
     async def validate_image_consistency(
@@ -41,7 +53,9 @@ class CharacterConsistencyValidator:
         """
         Validates that generated image matches the character reference.
         
-        Implements FR 3.1 validation logic using Vision API.
+        Implements FR 3.1 validation logic using Vision API. Comparisons are
+        idempotent, so results are memoized in-process and (when a Redis
+        client is configured) in Redis, keyed by a hash of the inputs.
         
         Args:
             generated_image_url: URL of the generated image
@@ -54,29 +68,18 @@ class CharacterConsistencyValidator:
         Raises:
             ValidationError: If validation fails or API error occurs
         """
+        cache_key = self._cache_key(generated_image_url, reference_image_url, character_id)
+        
         try:
-            # In production, this would:
-            # 1. Fetch both images
-            # 2. Send to Vision API (Gemini 3 Pro Vision or GPT-4o)
-            # 3. Ask: "Does the person in image A look like the same person in image B? Answer strictly YES or NO."
-            # 4. Parse response
-            
-            # Mock implementation for now
-            logger.info(
-                f"CharacterConsistencyValidator: Validating image for character {character_id}"
-            )
+            is_match = await self._get_cached_result(cache_key)
             
-            # Simulate API call
-            # In real implementation:
-            # response = await vision_api.compare_images(
-            #     image_a=generated_image_url,
-            #     image_b=reference_image_url,
-            #     prompt="Does the person in image A look like the same person in image B? Answer strictly YES or NO."
-            # )
-            # is_match = "YES" in response.upper()
-            
-            # Mock: Assume validation passes (in production, would use real API)
-            is_match = True
+            if is_match is None:
+                is_match = await self._compare_images(
+                    generated_image_url,
+                    reference_image_url,
+                    character_id
+                )
+                await self._store_result(cache_key, is_match)
             
             if not is_match:
                 raise ValidationError(
@@ -93,6 +96,82 @@ class CharacterConsistencyValidator:
             logger.error(f"CharacterConsistencyValidator: API error: {e}")
             raise ValidationError(f"Failed to validate image consistency: {e}")
     
+    async def _compare_images(
+        self,
+        generated_image_url: str,
+        reference_image_url: str,
+        character_id: str
+    ) -> bool:
+        """Asks the Vision API whether both images show the same character."""
+        # In production, this would:
+        # 1. Fetch both images
+        # 2. Send to Vision API (Gemini 3 Pro Vision or GPT-4o)
+        # 3. Ask: "Does the person in image A look like the same person in image B? Answer strictly YES or NO."
+        # 4. Parse response
+        
+        # Mock implementation for now
+        logger.info(
+            f"CharacterConsistencyValidator: Validating image for character {character_id}"
+        )
+        
+        # Simulate API call
+        # In real implementation:
+        # response = await vision_api.compare_images(
+        #     image_a=generated_image_url,
+        #     image_b=reference_image_url,
+        #     prompt="Does the person in image A look like the same person in image B? Answer strictly YES or NO."
+        # )
+        # return "YES" in response.upper()
+        
+        # Mock: Assume validation passes (in production, would use real API)
+        return True
+    
+    def _cache_key(self, generated_image_url: str, reference_image_url: str, character_id: str) -> str:
+        """Builds the memo key for a comparison (blake2b of the inputs and the vision model)."""
+        digest = hashlib.blake2b(
+            f"{self.vision_model}|{generated_image_url}|{reference_image_url}|{character_id}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return f"validator:{digest}"
+    
+    async def _get_cached_result(self, cache_key: str) -> Optional[bool]:
+        """Looks up a previous result in memory, then in Redis."""
+        is_match = _result_cache.get(cache_key)
+        if is_match is not None:
+            return is_match
+        
+        if not self.redis_client:
+            return None
+        
+        try:
+            value = await self.redis_client.get(cache_key)
+        except Exception as e:
+            logger.warning(f"CharacterConsistencyValidator: Redis lookup failed: {e}")
+            return None
+        
+        if value is None:
+            return None
+        
+        is_match = value in (b"1", "1")
+        _result_cache.set(cache_key, is_match)
+        return is_match
+    
+    async def _store_result(self, cache_key: str, is_match: bool) -> None:
+        """Records a fresh result in memory and, if configured, in Redis."""
+        _result_cache.set(cache_key, is_match)
+        
+        if not self.redis_client:
+            return
+        
+        try:
+            await self.redis_client.set(
+                cache_key,
+                b"1" if is_match else b"0",
+                ex=RESULT_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"CharacterConsistencyValidator: Redis store failed: {e}")
+    
     def get_character_reference_id(self, character_id: str) -> str:
         """
         Retrieves the canonical character reference ID/LoRA identifier.
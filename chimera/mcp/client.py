@@ -1,10 +1,28 @@
 import sys
 import os
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+import anyio
+from typing import Dict, Any, List, Optional, Tuple
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 from contextlib import AsyncExitStack
 
+logger = logging.getLogger(__name__)
+
+# Errors meaning the server subprocess or its pipes are gone, not that a tool failed
+_TRANSPORT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+# Required arguments per tool (Skills Contract, see skills/README.md).
+# Built once at import so validation is a single dict lookup per call.
+TOOL_REQUIRED_ARGUMENTS: Dict[str, Tuple[str, ...]] = {
+    "generate_image": ("character_id", "prompt"),
+    "post_tweet": ("content",),
+}
+
+
 class SkillExecutor:
     """
     Executes Agent Skills via Real MCP Tool calls.
@@ -15,6 +33,8 @@ class SkillExecutor:
         self.server_script_path = server_script_path
         self._exit_stack = AsyncExitStack()
         self._session: Optional[ClientSession] = None
+        # Set once the transport fails; SkillExecutorPool replaces such executors
+        self.disconnected = False
 
     async def initialize(self):
         """
@@ -27,17 +47,27 @@ class SkillExecutor:
             env=dict(os.environ) # Explicitly pass current env
         )
         
-        # Connect via stdio
-        read, write = await self._exit_stack.enter_async_context(
-            stdio_client(server_params)
-        )
-        
-        self._session = await self._exit_stack.enter_async_context(
-            ClientSession(read, write)
-        )
-        
-        # Initialize the session
-        await self._session.initialize()
+        try:
+            # Connect via stdio
+            read, write = await self._exit_stack.enter_async_context(
+                stdio_client(server_params)
+            )
+            
+            self._session = await self._exit_stack.enter_async_context(
+                ClientSession(read, write)
+            )
+            
+            # Initialize the session
+            await self._session.initialize()
+        except BaseException:
+            # Unwind whatever was entered so the subprocess and pipes don't leak
+            self._session = None
+            try:
+                await self._exit_stack.aclose()
+            except Exception as e:
+                logger.warning("Failed to clean up %s after a failed start: %s", self.server_script_path, e)
+            self._exit_stack = AsyncExitStack()
+            raise
 
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,16 +81,66 @@ class SkillExecutor:
             
         try:
             result = await self._session.call_tool(tool_name, arguments)
-            return {
-                "status": "success",
-                "tool": tool_name,
-                "result": result.content[0].text if result.content else "No output"
-            }
         except Exception as e:
+            self._note_failure(e)
+            result = e
+        return self._format_tool_result(tool_name, result)
+
+    async def execute_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Executes several MCP tools concurrently over the same session.
+        
+        All requests are written to the server before any response is awaited,
+        so round-trips overlap instead of queueing behind each other.
+        Results are returned in the same order as `calls`.
+        """
+        # Validate every call up front so a bad one fails before anything is sent
+        for tool_name, arguments in calls:
+            self._validate_tool_call(tool_name, arguments)
+
+        if not self._session:
+            await self.initialize()
+
+        tasks = [
+            asyncio.create_task(self._session.call_tool(tool_name, arguments))
+            for tool_name, arguments in calls
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self._note_failure(result)
+
+        return [
+            self._format_tool_result(tool_name, result)
+            for (tool_name, _), result in zip(calls, results)
+        ]
+
+    def _note_failure(self, error: BaseException):
+        """
+        Marks the executor as disconnected if the error came from the transport.
+        
+        Tool errors leave the session usable; a dead server subprocess does not.
+        """
+        if isinstance(error, _TRANSPORT_ERRORS) or (
+            isinstance(error, McpError) and error.error.code == CONNECTION_CLOSED
+        ):
+            self.disconnected = True
+
+    def _format_tool_result(self, tool_name: str, result: Any) -> Dict[str, Any]:
+        """
+        Converts a CallToolResult (or the exception raised instead) into the
+        standard skill response dict.
+        """
+        if isinstance(result, BaseException):
             return {
                 "status": "failed",
-                "error": str(e)
+                "error": str(result)
             }
+        return {
+            "status": "success",
+            "tool": tool_name,
+            "result": result.content[0].text if result.content else "No output"
+        }
 
     async def read_resource(self, uri: str) -> Dict[str, Any]:
         """
@@ -94,6 +174,7 @@ class SkillExecutor:
                  return {"status": "success", "uri": uri, "content": ""}
 
         except Exception as e:
+            self._note_failure(e)
             return {
                 "status": "failed",
                 "error": str(e)
@@ -110,7 +191,8 @@ class SkillExecutor:
             # Note: The MCP SDK ClientSession typically exposes list_tools
             result = await self._session.list_tools()
             return result.tools
-        except Exception:
+        except Exception as e:
+            self._note_failure(e)
             return []
 
     def _validate_tool_call(self, tool_name: str, arguments: Dict[str, Any]):
@@ -118,18 +200,154 @@ class SkillExecutor:
         Validates arguments against known schemas (Skills Contract).
         This matches the logic defined in skills/README.md.
         """
-        if tool_name == "generate_image":
-            if "character_id" not in arguments:
-                raise ValueError("character_id is required for generate_image")
-            if "prompt" not in arguments:
-                raise ValueError("prompt is required for generate_image")
-        
-        if tool_name == "post_tweet":
-            if "content" not in arguments:
-                raise ValueError("content is required for post_tweet")
+        for field in TOOL_REQUIRED_ARGUMENTS.get(tool_name, ()):
+            if field not in arguments:
+                raise ValueError(f"{field} is required for {tool_name}")
 
     async def cleanup(self):
         """
         Closes connections.
         """
         await self._exit_stack.aclose()
+
+
+class _OwnedSession:
+    """
+    Runs a SkillExecutor's session inside a dedicated owner task.
+    
+    The stdio transport and ClientSession are anyio task groups, which must
+    be exited by the task that entered them. Pooled executors are shared by
+    many callers, so no caller can own them; the owner task opens the
+    session, parks until stop() is called, then closes it. If the event loop
+    shuts down first, the loop cancels the owner, which still closes the
+    session from the right task.
+    """
+    
+    def __init__(self, executor: SkillExecutor):
+        self.executor = executor
+        self._finished = asyncio.Event()
+        self._owner: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """Starts the owner task and waits until the session is initialized."""
+        ready = asyncio.Event()
+        
+        async def own_session():
+            await self.executor.initialize()
+            try:
+                ready.set()
+                await self._finished.wait()
+            finally:
+                await self.executor.cleanup()
+        
+        self._owner = asyncio.create_task(
+            own_session(), name=f"mcp-session:{self.executor.server_script_path}"
+        )
+        ready_wait = asyncio.create_task(ready.wait())
+        await asyncio.wait({self._owner, ready_wait}, return_when=asyncio.FIRST_COMPLETED)
+        if self._owner.done():
+            ready_wait.cancel()
+            self._owner.result()  # Surface the initialization error
+    
+    async def stop(self):
+        """Asks the owner task to close the session and waits for it, logging shutdown failures."""
+        self._finished.set()
+        try:
+            await self._owner
+        except Exception as e:
+            logger.warning("Failed to shut down MCP server %s: %s", self.executor.server_script_path, e)
+
+
+class SkillExecutorPool:
+    """
+    Process-wide registry of initialized SkillExecutors.
+    
+    Keeps one MCP server subprocess per server script and event loop, so
+    repeated tool calls reuse the same session instead of paying interpreter
+    startup and the initialize handshake each time. MCP sessions multiplex
+    requests, so a single executor can serve concurrent callers. Each session
+    is owned by a dedicated task (see _OwnedSession), so any task may close
+    it. An executor whose server has died is evicted and replaced on the
+    next get(); executors belonging to a closed event loop are forgotten.
+    """
+    
+    _pool: Dict[Tuple[asyncio.AbstractEventLoop, str], _OwnedSession] = {}
+    _locks: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Lock] = {}
+    
+    @staticmethod
+    def _key(server_script_path: str) -> Tuple[asyncio.AbstractEventLoop, str]:
+        return asyncio.get_running_loop(), os.path.abspath(server_script_path)
+    
+    @classmethod
+    def _forget_closed_loops(cls):
+        """Drops entries whose event loop has closed; their owner tasks were cancelled with it."""
+        for registry in (cls._pool, cls._locks):
+            for key in [key for key in registry if key[0].is_closed()]:
+                del registry[key]
+    
+    @classmethod
+    async def get(cls, server_script_path: str) -> SkillExecutor:
+        """
+        Returns the shared executor for a server script, starting it on first use.
+        """
+        key = cls._key(server_script_path)
+        session = cls._pool.get(key)
+        if session is not None and not session.executor.disconnected:
+            return session.executor
+        
+        cls._forget_closed_loops()
+        lock = cls._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have finished initializing while we waited
+            session = cls._pool.get(key)
+            if session is not None and session.executor.disconnected:
+                logger.warning("MCP server %s disconnected; restarting it", key[1])
+                del cls._pool[key]
+                await session.stop()
+                session = None
+            if session is None:
+                session = _OwnedSession(SkillExecutor(server_script_path=key[1]))
+                await session.start()
+                cls._pool[key] = session
+        
+        return session.executor
+    
+    @classmethod
+    def running(cls, server_script_path: str) -> Optional[SkillExecutor]:
+        """
+        Returns the live pooled executor for a server script without starting one.
+        """
+        session = cls._pool.get(cls._key(server_script_path))
+        if session is None or session.executor.disconnected:
+            return None
+        return session.executor
+    
+    @classmethod
+    async def close(cls, server_script_path: str, executor: Optional[SkillExecutor] = None):
+        """
+        Shuts down the pooled server subprocess for one server script.
+        
+        If `executor` is given, only closes it if it is still the pooled one,
+        so an owner never tears down a replacement started by someone else.
+        """
+        key = cls._key(server_script_path)
+        session = cls._pool.get(key)
+        if session is None or (executor is not None and session.executor is not executor):
+            return
+        del cls._pool[key]
+        await session.stop()
+    
+    @classmethod
+    async def close_all(cls):
+        """
+        Shuts down every pooled server subprocess running on the current event loop.
+        """
+        loop = asyncio.get_running_loop()
+        cls._forget_closed_loops()
+        keys = [key for key in cls._pool if key[0] is loop]
+        sessions = [cls._pool.pop(key) for key in keys]
+        for key in [key for key in cls._locks if key[0] is loop]:
+            del cls._locks[key]
+        
+        for session in sessions:
+            await session.stop()
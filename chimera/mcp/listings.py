@@ -0,0 +1,61 @@
+"""
+FastMCP server that memoizes its tools/list and resources/list responses.
+
+MCP clients send listing requests on every (re)connect, and FastMCP
+rebuilds every schema object for each one. Our servers register a fixed
+set of tools and resources at import, so the responses rarely change.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+
+
+class CachedListingsMCP(FastMCP):
+    """
+    FastMCP with cached tool, resource and resource template listings.
+
+    Each listing is keyed on the registered objects themselves (name and
+    definition), not on how many there are. Adding, removing or replacing a
+    registration, including remove_tool() followed by add_tool() under the
+    same name, rebuilds the listing on the next request.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        # Set before FastMCP.__init__, which registers the list_* handlers below
+        self._listings: Dict[str, Tuple[Tuple[Any, ...], List[Any]]] = {}
+        super().__init__(*args, **kwargs)
+
+    async def _cached_listing(
+        self,
+        kind: str,
+        registered: Sequence[Any],
+        build: Callable[[], Awaitable[List[Any]]],
+    ) -> List[Any]:
+        """Returns a copy of the cached listing, rebuilding it if the registrations changed."""
+        snapshot = tuple(registered)
+        cached = self._listings.get(kind)
+        if cached is None or not _same_registrations(cached[0], snapshot):
+            cached = (snapshot, await build())
+            self._listings[kind] = cached
+        return list(cached[1])
+
+    async def list_tools(self) -> List[types.Tool]:
+        """List all available tools."""
+        return await self._cached_listing("tools", self._tool_manager.list_tools(), super().list_tools)
+
+    async def list_resources(self) -> List[types.Resource]:
+        """List all available resources."""
+        return await self._cached_listing(
+            "resources", self._resource_manager.list_resources(), super().list_resources
+        )
+
+    async def list_resource_templates(self) -> List[types.ResourceTemplate]:
+        """List all available resource templates."""
+        return await self._cached_listing(
+            "templates", self._resource_manager.list_templates(), super().list_resource_templates
+        )
+
+
+def _same_registrations(cached: Tuple[Any, ...], current: Tuple[Any, ...]) -> bool:
+    """True if both snapshots hold the very same registration objects, in order."""
+    return len(cached) == len(current) and all(a is b for a, b in zip(cached, current))
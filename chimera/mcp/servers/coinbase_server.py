@@ -6,6 +6,7 @@ Exposes wallet operations as MCP Tools for the Chimera agents.
 from mcp.server.fastmcp import FastMCP
 from typing import Dict, Any, Optional
 import os
+import threading
 from chimera.core.commerce import CommerceManager
 
 # Create FastMCP server
@@ -13,30 +14,37 @@ mcp = FastMCP("chimera-coinbase")
 
 # Initialize commerce manager (lazy initialization)
 _commerce_manager: Optional[CommerceManager] = None
+_commerce_manager_lock = threading.Lock()
 
 
 def get_commerce_manager() -> CommerceManager:
-    """Gets or creates the commerce manager instance."""
+    """
+    Gets or creates the commerce manager instance.
+    
+    Double-checked locking ensures concurrent first calls share a single
+    manager (and its wallet/API client connections).
+    """
     global _commerce_manager
     if _commerce_manager is None:
-        _commerce_manager = CommerceManager(
-            api_key_name=os.getenv("CDP_API_KEY_NAME"),
-            api_key_private_key=os.getenv("CDP_API_KEY_PRIVATE_KEY")
-        )
+        with _commerce_manager_lock:
+            if _commerce_manager is None:
+                _commerce_manager = CommerceManager(
+                    api_key_name=os.getenv("CDP_API_KEY_NAME"),
+                    api_key_private_key=os.getenv("CDP_API_KEY_PRIVATE_KEY")
+                )
     return _commerce_manager
 
 
 @mcp.resource("wallet://balance/{currency}")
-def get_wallet_balance_resource(currency: str = "USDC") -> str:
+async def get_wallet_balance_resource(currency: str = "USDC") -> str:
     """
     Resource: Returns current wallet balance.
     
     Args:
         currency: Currency symbol (USDC, ETH)
     """
-    import asyncio
     manager = get_commerce_manager()
-    balance = asyncio.run(manager.get_balance(currency))
+    balance = await manager.get_balance(currency)
     return f"Balance: {balance} {currency}"
 
 
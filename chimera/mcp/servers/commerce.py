@@ -7,6 +7,7 @@ Exposes financial tools (CommerceManager) to the agent swarm.
 from typing import Any, Dict
 from mcp.server.fastmcp import FastMCP
 import logging
+import threading
 from chimera.core.commerce import CommerceManager, AGENTKIT_AVAILABLE
 
 # Configure Logging
@@ -17,17 +18,21 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("chimera-commerce")
 
 # Initialize CommerceManager
-# Note: In a real deployment, this might be a singleton or instanced per-request context
+# Process-wide singleton, created on first use under a lock so concurrent
+# first calls cannot build duplicate wallet/API clients
 commerce_manager = None
+_commerce_manager_lock = threading.Lock()
 
 def get_commerce_manager() -> CommerceManager:
     global commerce_manager
-    if not commerce_manager:
-        try:
-            commerce_manager = CommerceManager()
-        except Exception as e:
-            logger.error(f"Failed to initialize CommerceManager: {e}")
-            raise RuntimeError("Commerce capabilities unavailable.")
+    if commerce_manager is None:
+        with _commerce_manager_lock:
+            if commerce_manager is None:
+                try:
+                    commerce_manager = CommerceManager()
+                except Exception as e:
+                    logger.error(f"Failed to initialize CommerceManager: {e}")
+                    raise RuntimeError("Commerce capabilities unavailable.")
     return commerce_manager
 
 @mcp.tool()
@@ -1,11 +1,12 @@
 from mcp.server.fastmcp import FastMCP
 from typing import Dict, Any
+import hashlib
 import os
 from google import genai
 from google.genai import types
 from pathlib import Path
-import time
 import logging
+from chimera.core.cache import LRUCache
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -30,15 +31,57 @@ def ensure_output_dir():
 
 IMAGE_DIR = ensure_output_dir()
 
+# Successful generations keyed by prompt hash, evicted LRU-first
+IMAGE_CACHE_MAXSIZE = 4096
+_image_cache: LRUCache[str, Dict[str, Any]] = LRUCache(maxsize=IMAGE_CACHE_MAXSIZE)
+
+
+def prompt_key(prompt: str, character_id: str) -> str:
+    """Returns a stable, content-addressed key for a (character, prompt) pair."""
+    return hashlib.blake2b(f"{character_id}|{prompt}".encode(), digest_size=8).hexdigest()
+
+
+def to_web_path(filepath: Path) -> str:
+    """Returns a path suitable for the frontend."""
+    if "frontend/public" in str(filepath):
+        return f"/generated/{filepath.name}"
+    return str(filepath)
+
+
 @mcp.tool()
 def generate_image(prompt: str, character_id: str = "default") -> Dict[str, Any]:
     """
     Generates an image based on the prompt using Google's Imagen model via new SDK.
     
+    Results are content-addressed by (character_id, prompt), so repeat
+    prompts return the same URL without calling the model again.
+    
     Args:
         prompt: The description of the image.
         character_id: Optional character consistency ID.
     """
+    # Enhance prompt with character consistency (basic injection)
+    full_prompt = prompt
+    if character_id != "default":
+         full_prompt = f"{prompt} -- Context: Character ID {character_id}, maintain consistent style."
+    
+    key = prompt_key(prompt, character_id)
+    cached = _image_cache.get(key)
+    if cached and Path(cached["local_path"]).exists():
+        return cached
+    
+    # Reuse an image generated by a previous server process
+    filepath = IMAGE_DIR / f"{character_id}_{key}.png"
+    if filepath.exists():
+        result = {
+            "status": "success",
+            "local_path": str(filepath),
+            "url": to_web_path(filepath),
+            "prompt": full_prompt
+        }
+        _image_cache.set(key, result)
+        return result
+    
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
          return {
@@ -49,11 +92,6 @@ def generate_image(prompt: str, character_id: str = "default") -> Dict[str, Any]
     try:
         client = genai.Client(api_key=api_key)
         
-        # Enhance prompt with character consistency (basic injection)
-        full_prompt = prompt
-        if character_id != "default":
-             full_prompt = f"{prompt} -- Context: Character ID {character_id}, maintain consistent style."
-
         logger.info(f"Generating image for prompt: {full_prompt}")
         # Using correct method for new SDK
         response = client.models.generate_images(
@@ -72,36 +110,27 @@ def generate_image(prompt: str, character_id: str = "default") -> Dict[str, Any]
         image_bytes = generated_image.image.image_bytes
         
         # Save to disk
-        timestamp = int(time.time())
-        filename = f"{character_id}_{timestamp}.png"
-        filepath = IMAGE_DIR / filename
-        
         with open(filepath, "wb") as f:
             f.write(image_bytes)
         
         logger.info(f"Saved generated image to {filepath}")
 
-        # Return path suitable for frontend
-        if "frontend/public" in str(filepath):
-             web_path = f"/generated/{filename}"
-        else:
-             web_path = str(filepath)
-
-        return {
+        result = {
             "status": "success",
             "local_path": str(filepath),
-            "url": web_path,
+            "url": to_web_path(filepath),
             "prompt": full_prompt
         }
+        _image_cache.set(key, result)
+        return result
     except Exception as e:
         logger.warning(f"Image generation failed (likely billing/access): {e}")
         logger.info("Falling back to MOCK generation.")
         
         # Fallback: Create a text file or just return a mock URL
         # For better DX, let's try to make a dummy image file if possible
-        timestamp = int(time.time())
-        filename = f"mock_{character_id}_{timestamp}.png"
-        filepath = IMAGE_DIR / filename
+        # (not cached, so the next call retries the real model)
+        filepath = IMAGE_DIR / f"mock_{character_id}_{key}.png"
         
         # Create a simple 1x1 pixel image or just a file
         try:
@@ -113,15 +142,10 @@ def generate_image(prompt: str, character_id: str = "default") -> Dict[str, Any]
             with open(filepath, "w") as f:
                 f.write("Mock Image Content")
         
-        if "frontend/public" in str(filepath):
-             web_path = f"/generated/{filename}"
-        else:
-             web_path = str(filepath)
-             
         return {
             "status": "success",
             "local_path": str(filepath),
-            "url": web_path,
+            "url": to_web_path(filepath),
             "prompt": prompt,
             "note": "Generated via Mock Fallback (API Error)"
         }
@@ -1,6 +1,11 @@
 from mcp.server.fastmcp import FastMCP
+from typing import List, NamedTuple, Optional
+import asyncio
 import feedparser
+import httpx
 import logging
+import time
+from chimera.core.cache import LRUCache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -15,39 +20,164 @@ DEFAULT_FEEDS = {
     "wired": "https://www.wired.com/feed/rss"
 }
 
+# Shared HTTP client (lazy initialization) so TLS connections are reused,
+# plus the task that closes it when its event loop shuts down
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_closer: Optional[asyncio.Task] = None
+
+FETCH_TIMEOUT = httpx.Timeout(5.0)
+
+
+class _CachedFeed(NamedTuple):
+    """A parsed feed plus the validators needed for a conditional GET."""
+    fetched_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    feed: feedparser.FeedParserDict
+
+
+# Parsed feeds keyed by URL, evicted LRU-first. Entries outlive FEED_CACHE_TTL
+# on purpose: stale ones still carry the validators for a conditional GET.
+FEED_CACHE_TTL = 60.0  # seconds
+FEED_CACHE_MAXSIZE = 128
+_feed_cache: LRUCache[str, _CachedFeed] = LRUCache(maxsize=FEED_CACHE_MAXSIZE)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Gets or creates the shared HTTP client instance.
+    
+    Pooled connections belong to the event loop that opened them, so a new
+    client is created when called from a different loop (e.g. successive
+    asyncio.run() calls in scripts). Each client is closed on its own loop
+    when that loop shuts down, which includes the server's at exit.
+    """
+    global _http_client, _http_client_closer
+    loop = asyncio.get_running_loop()
+    if (
+        _http_client is None
+        or _http_client.is_closed
+        or _http_client_closer is None
+        or _http_client_closer.get_loop() is not loop
+    ):
+        if _http_client_closer is not None and _http_client_closer.get_loop() is loop:
+            _http_client_closer.cancel()
+        _http_client = httpx.AsyncClient(timeout=FETCH_TIMEOUT, follow_redirects=True)
+        _http_client_closer = loop.create_task(_close_at_loop_shutdown(_http_client))
+    return _http_client
+
+
+async def _close_at_loop_shutdown(client: httpx.AsyncClient) -> None:
+    """Parks until cancelled (asyncio.run cancels pending tasks on exit), then closes client."""
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+
+async def fetch_and_parse(url: str) -> feedparser.FeedParserDict:
+    """
+    Downloads a feed over the shared HTTP client and parses it.
+    
+    feedparser is CPU-bound, so parsing runs in the default executor
+    to keep the event loop free for the other in-flight fetches.
+    """
+    response = await get_http_client().get(url)
+    response.raise_for_status()
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, feedparser.parse, response.content)
+
+
+async def _fetch_source_headlines(source: str, url: str) -> List[str]:
+    """Fetches the top headlines for a single source as formatted lines."""
+    try:
+        logger.info(f"Fetching {source} from {url}...")
+        feed = await fetch_and_parse(url)
+        
+        if feed.bozo:
+            logger.warning(f"Error parsing feed {source}: {feed.bozo_exception}")
+            return []
+            
+        # Get top 5 entries
+        return [
+            f"- [{source.upper()}] {entry.title} ({entry.link})"
+            for entry in feed.entries[:5]
+        ]
+        
+    except Exception as e:
+        logger.error(f"Failed to fetch {source}: {e}")
+        return [f"- [{source.upper()}] Error: Could not fetch feed"]
+
+
 @mcp.resource("news://latest")
-def get_latest_news() -> str:
+async def get_latest_news() -> str:
     """
     Fetches the latest headlines from configured tech news sources.
     Returns a formatted string of headlines.
+    
+    Sources are fetched concurrently, so latency tracks the slowest feed
+    rather than the sum of all feeds.
     """
-    all_news = []
+    results = await asyncio.gather(*[
+        _fetch_source_headlines(source, url)
+        for source, url in DEFAULT_FEEDS.items()
+    ])
     
-    # In a real async scenario, we'd fetch these concurrently
-    # feedparser is blocking, so we keep it simple for now
+    all_news = [line for lines in results for line in lines]
+    return "\n".join(all_news)
+
+async def parse_feed_cached(url: str) -> feedparser.FeedParserDict:
+    """
+    Parses a feed URL, reusing the cached result for FEED_CACHE_TTL seconds.
     
-    for source, url in DEFAULT_FEEDS.items():
-        try:
-            logger.info(f"Fetching {source} from {url}...")
-            feed = feedparser.parse(url)
-            
-            if feed.bozo:
-                logger.warning(f"Error parsing feed {source}: {feed.bozo_exception}")
-                continue
-                
-            # Get top 5 entries
-            entries = feed.entries[:5]
-            for entry in entries:
-                all_news.append(f"- [{source.upper()}] {entry.title} ({entry.link})")
-                
-        except Exception as e:
-            logger.error(f"Failed to fetch {source}: {e}")
-            all_news.append(f"- [{source.upper()}] Error: Could not fetch feed")
+    Once an entry expires it is revalidated with If-None-Match/If-Modified-Since,
+    so an unchanged feed answers 304 and skips the download and XML parse.
+    """
+    now = time.monotonic()
+    cached = _feed_cache.get(url)
+    
+    if cached and now - cached.fetched_at < FEED_CACHE_TTL:
+        return cached.feed
+    
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    
+    response = await get_http_client().get(url, headers=headers)
+    
+    if cached and response.status_code == 304:
+        feed = cached.feed
+    else:
+        response.raise_for_status()
+        loop = asyncio.get_running_loop()
+        feed = await loop.run_in_executor(None, feedparser.parse, response.content)
+        
+        # Never cache failures, so the next call retries the source
+        if feed.bozo:
+            return feed
+    
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cached and response.status_code == 304:
+        # A 304 need not repeat the validators; keep the ones it confirmed
+        etag = etag or cached.etag
+        last_modified = last_modified or cached.last_modified
+    
+    _feed_cache.set(url, _CachedFeed(
+        fetched_at=now,
+        etag=etag,
+        last_modified=last_modified,
+        feed=feed,
+    ))
+    
+    return feed
 
-    return "\n".join(all_news)
 
 @mcp.tool()
-def read_feed(url: str, limit: int = 5) -> str:
+async def read_feed(url: str, limit: int = 5) -> str:
     """
     Reads a specific RSS feed URL and returns the top items.
     
@@ -56,7 +186,7 @@ def read_feed(url: str, limit: int = 5) -> str:
         limit: Number of items to return.
     """
     try:
-        feed = feedparser.parse(url)
+        feed = await parse_feed_cached(url)
         if feed.bozo:
              return f"Error parsing feed: {feed.bozo_exception}"
         
@@ -4,10 +4,17 @@ MCP Server for Social Media Abstraction.
 
 Implements FR 4.0: Platform-Agnostic Publishing using MCP.
 """
-from typing import Any, Dict, List
-from mcp.server.fastmcp import FastMCP
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
+from typing_extensions import NotRequired, TypedDict
+from mcp.server.fastmcp import Context
+from chimera.mcp.listings import CachedListingsMCP
+from pydantic import Field, TypeAdapter, ValidationError
+import asyncio
 import logging
+import orjson
+import time
 from abc import ABC, abstractmethod
+from enum import IntEnum
 from datetime import datetime
 
 # Configure Logging
@@ -15,7 +22,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastMCP
-mcp = FastMCP("chimera-social")
+mcp = CachedListingsMCP("chimera-social")
+
+# Last formatted timestamp as [epoch_second, isoformat]; mentions only need
+# second resolution, so the datetime is rebuilt at most once per second
+_LAST_TS_SEC: List[Any] = [0, ""]
+
+def _cached_now_iso() -> str:
+    """Returns the current local time as an ISO string, truncated to seconds."""
+    now = int(time.time())
+    if now != _LAST_TS_SEC[0]:
+        _LAST_TS_SEC[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _LAST_TS_SEC[1]
 
 class SocialAdapter(ABC):
     """Abstract base class for social platform adapters."""
@@ -36,7 +54,7 @@ class MockTwitterAdapter(SocialAdapter):
     """Mock adapter for Twitter/X."""
     
     async def post_content(self, content: str, media_urls: List[str] = []) -> Dict[str, Any]:
-        logger.info(f"[MockTwitter] Posting: {content} | Media: {media_urls}")
+        logger.info("[MockTwitter] Posting: %s | Media: %s", content, media_urls)
         return {
             "platform": "twitter",
             "status": "success",
@@ -45,7 +63,7 @@ class MockTwitterAdapter(SocialAdapter):
         }
 
     async def reply_to_mention(self, mention_id: str, content: str) -> Dict[str, Any]:
-        logger.info(f"[MockTwitter] Replying to {mention_id}: {content}")
+        logger.info("[MockTwitter] Replying to %s: %s", mention_id, content)
         return {
             "platform": "twitter",
             "status": "success",
@@ -60,7 +78,7 @@ class MockTwitterAdapter(SocialAdapter):
                 "id": "mention_abc123",
                 "user": "fan_user",
                 "content": "Hey @chimera, what do you think about crypto?",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _cached_now_iso(),
                 "platform": "twitter"
             }
         ]
@@ -72,7 +90,7 @@ class MockInstagramAdapter(SocialAdapter):
         if not media_urls:
             return {"status": "error", "message": "Instagram requires media"}
             
-        logger.info(f"[MockInstagram] Posting: {content} | Media: {media_urls}")
+        logger.info("[MockInstagram] Posting: %s | Media: %s", content, media_urls)
         return {
             "platform": "instagram",
             "status": "success",
@@ -81,7 +99,7 @@ class MockInstagramAdapter(SocialAdapter):
         }
 
     async def reply_to_mention(self, mention_id: str, content: str) -> Dict[str, Any]:
-        logger.info(f"[MockInstagram] Replying to comment {mention_id}: {content}")
+        logger.info("[MockInstagram] Replying to comment %s: %s", mention_id, content)
         return {
             "platform": "instagram",
             "status": "success",
@@ -93,23 +111,59 @@ class MockInstagramAdapter(SocialAdapter):
         return []
 
 # Adapter Registry
-adapters: Dict[str, SocialAdapter] = {
-    "twitter": MockTwitterAdapter(),
-    "x": MockTwitterAdapter(), # Alias
-    "instagram": MockInstagramAdapter()
+# The platform set is closed, so adapters live in a tuple indexed by
+# Platform; names (lowercase, with aliases) map to that index once at import
+class Platform(IntEnum):
+    TWITTER = 0
+    INSTAGRAM = 1
+
+_ADAPTERS: Tuple[SocialAdapter, ...] = (
+    MockTwitterAdapter(),   # Platform.TWITTER
+    MockInstagramAdapter(), # Platform.INSTAGRAM
+)
+
+_NAME_TO_IDX: Dict[str, Platform] = {
+    "twitter": Platform.TWITTER,
+    "x": Platform.TWITTER, # Alias
+    "instagram": Platform.INSTAGRAM,
 }
 
 def get_adapter(platform: str) -> SocialAdapter:
-    adapter = adapters.get(platform.lower())
-    if not adapter:
-        raise ValueError(f"Unsupported platform: {platform}")
-    return adapter
+    idx = _NAME_TO_IDX.get(platform)
+    if idx is None:
+        # Slow path: only mixed-case names pay for lower()
+        idx = _NAME_TO_IDX.get(platform.lower())
+        if idx is None:
+            raise ValueError(f"Unsupported platform: {platform}")
+    return _ADAPTERS[idx]
+
+async def _report_progress(ctx: Optional[Context], progress: float, message: str) -> None:
+    """
+    Reports tool progress to the MCP client; a no-op for direct calls.
+    
+    Best-effort: a failed notification (e.g. the client went away) is logged
+    and never changes the outcome of the operation being reported on.
+    """
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(progress, total=1.0, message=message)
+    except Exception as e:
+        logger.warning("Failed to report progress (%s): %s", message, e)
 
 @mcp.tool()
-async def post_content(platform: str, content: str, media_urls: List[str] = []) -> Dict[str, Any]:
+async def post_content(
+    platform: str,
+    content: str,
+    media_urls: List[str] = [],
+    ctx: Optional[Context] = None
+) -> Dict[str, Any]:
     """
     Publishes content to a specific social platform.
     
+    Deprecated: prefer execute_social_batch, which runs several operations
+    in one call.
+    
     Args:
         platform: 'twitter', 'instagram', etc.
         content: The text content of the post.
@@ -117,16 +171,29 @@ async def post_content(platform: str, content: str, media_urls: List[str] = [])
     """
     try:
         adapter = get_adapter(platform)
-        return await adapter.post_content(content, media_urls)
+        await _report_progress(ctx, 0.1, f"dispatching to {platform}")
+        result = await adapter.post_content(content, media_urls)
     except Exception as e:
         logger.error(f"Failed to post to {platform}: {e}")
         return {"status": "error", "message": str(e)}
+    
+    # Outside the try: the platform call already succeeded
+    await _report_progress(ctx, 1.0, "platform acknowledged")
+    return result
 
 @mcp.tool()
-async def reply_to_mention(platform: str, mention_id: str, content: str) -> Dict[str, Any]:
+async def reply_to_mention(
+    platform: str,
+    mention_id: str,
+    content: str,
+    ctx: Optional[Context] = None
+) -> Dict[str, Any]:
     """
     Replies to a specific mention or comment.
     
+    Deprecated: prefer execute_social_batch, which runs several operations
+    in one call.
+    
     Args:
         platform: 'twitter', 'instagram', etc.
         mention_id: The ID of the post/comment to reply to.
@@ -134,23 +201,106 @@ async def reply_to_mention(platform: str, mention_id: str, content: str) -> Dict
     """
     try:
         adapter = get_adapter(platform)
-        return await adapter.reply_to_mention(mention_id, content)
+        await _report_progress(ctx, 0.1, f"dispatching to {platform}")
+        result = await adapter.reply_to_mention(mention_id, content)
     except Exception as e:
         logger.error(f"Failed to reply on {platform}: {e}")
         return {"status": "error", "message": str(e)}
+    
+    # Outside the try: the platform call already succeeded
+    await _report_progress(ctx, 1.0, "platform acknowledged")
+    return result
+
+class _PostContentOp(TypedDict):
+    op: Literal["post_content"]
+    platform: str
+    content: str
+    media_urls: NotRequired[List[str]]
+
+class _ReplyToMentionOp(TypedDict):
+    op: Literal["reply_to_mention"]
+    platform: str
+    mention_id: str
+    content: str
+
+class _GetMentionsOp(TypedDict):
+    op: Literal["get_mentions"]
+    platform: str
+
+# Built once at import; validating an op is then a single compiled call
+_SOCIAL_OP = TypeAdapter(Annotated[
+    Union[_PostContentOp, _ReplyToMentionOp, _GetMentionsOp],
+    Field(discriminator="op")
+])
+
+def _parse_social_op(op: Dict[str, Any]) -> Dict[str, Any]:
+    """Validates a batch operation, raising ValueError with a readable reason."""
+    try:
+        return _SOCIAL_OP.validate_python(op)
+    except ValidationError as e:
+        name = op.get("op") if isinstance(op, dict) else None
+        error = e.errors()[0]
+        if error["type"] in ("union_tag_invalid", "union_tag_not_found"):
+            raise ValueError(f"Unsupported op: {name}")
+        if error["type"] == "missing":
+            raise ValueError(f"Missing argument '{error['loc'][-1]}' for {name}")
+        raise ValueError(f"Invalid argument '{error['loc'][-1]}' for {name}: {error['msg']}")
+
+async def _run_social_op(op: Dict[str, Any]) -> Any:
+    """Dispatches a single batch operation to its platform adapter."""
+    op = _parse_social_op(op)
+    name = op["op"]
+    adapter = get_adapter(op["platform"])
+    if name == "post_content":
+        return await adapter.post_content(op["content"], op.get("media_urls", []))
+    if name == "reply_to_mention":
+        return await adapter.reply_to_mention(op["mention_id"], op["content"])
+    return await adapter.get_mentions()
+
+@mcp.tool()
+async def execute_social_batch(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Runs several social operations concurrently in a single call.
+    
+    Each op is a dict with an 'op' name and the arguments of the matching
+    single-purpose tool:
+    - {"op": "post_content", "platform": ..., "content": ..., "media_urls": [...]}
+    - {"op": "reply_to_mention", "platform": ..., "mention_id": ..., "content": ...}
+    - {"op": "get_mentions", "platform": ...}
+    
+    A failing op does not affect the others. Returns one entry per op, in
+    order: {"index", "status", "result"} or {"index", "status", "error"}.
+    
+    Args:
+        ops: The operations to execute.
+    """
+    outcomes = await asyncio.gather(
+        *[_run_social_op(op) for op in ops],
+        return_exceptions=True
+    )
+    
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Batch op {index} failed: {outcome}")
+            results.append({"index": index, "status": "error", "error": str(outcome)})
+        elif isinstance(outcome, dict) and outcome.get("status") == "error":
+            results.append({"index": index, "status": "error", "error": outcome.get("message", "")})
+        else:
+            results.append({"index": index, "status": "success", "result": outcome})
+    return results
 
 @mcp.resource("social://{platform}/mentions")
 async def get_mentions(platform: str) -> str:
     """
     Returns recent mentions as a JSON string.
     """
-    import json
     try:
         adapter = get_adapter(platform)
         mentions = await adapter.get_mentions()
-        return json.dumps(mentions, indent=2)
+        return orjson.dumps(mentions, option=orjson.OPT_INDENT_2).decode()
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return orjson.dumps({"error": str(e)}).decode()
 
 if __name__ == "__main__":
     mcp.run()
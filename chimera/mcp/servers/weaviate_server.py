@@ -4,28 +4,128 @@ MCP Server for Weaviate Memory Integration.
 Exposes memory operations as MCP Tools and Resources for the Chimera agents.
 """
 from mcp.server.fastmcp import FastMCP
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from contextlib import asynccontextmanager
+from itertools import islice
+import asyncio
 import os
-from chimera.core.memory import MemoryManager
+import re
+import threading
+from chimera.core.cache import LRUCache
+from chimera.core.memory import MemoryManager, NO_LONG_TERM_MEMORIES
+from chimera.mcp.listings import CachedListingsMCP
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Warms the memory manager in the background while a session starts.
+    
+    Requests that arrive before warm-up finishes wait on the manager lock
+    instead of opening a second connection. FastMCP enters the lifespan once
+    per session on the SSE and streamable-HTTP transports, so the shared
+    client is left open here and closed by main() at process shutdown.
+    """
+    warmup = asyncio.create_task(asyncio.to_thread(warm_memory_manager))
+    try:
+        yield
+    finally:
+        await asyncio.gather(warmup, return_exceptions=True)
+
 
 # Create FastMCP server
-mcp = FastMCP("chimera-weaviate")
+mcp = CachedListingsMCP("chimera-weaviate", lifespan=lifespan)
 
 # Initialize memory manager (lazy initialization)
 _memory_manager: Optional[MemoryManager] = None
+_memory_manager_lock = threading.Lock()
 
 
 def get_memory_manager() -> MemoryManager:
-    """Gets or creates the memory manager instance."""
+    """
+    Gets or creates the memory manager instance.
+    
+    Double-checked locking ensures concurrent first calls share a single
+    Weaviate client (and its connection pool).
+    """
     global _memory_manager
     if _memory_manager is None:
-        _memory_manager = MemoryManager(
-            weaviate_url=os.getenv("WEAVIATE_URL", "http://localhost:8080"),
-            api_key=os.getenv("WEAVIATE_API_KEY")
-        )
+        with _memory_manager_lock:
+            if _memory_manager is None:
+                _memory_manager = MemoryManager(
+                    weaviate_url=os.getenv("WEAVIATE_URL", "http://localhost:8080"),
+                    api_key=os.getenv("WEAVIATE_API_KEY")
+                )
     return _memory_manager
 
 
+def reset_memory_manager() -> None:
+    """
+    Closes the current Weaviate client and forgets the manager.
+    
+    The next get_memory_manager() call reconnects from scratch; use this to
+    recover after persistent Weaviate connection errors.
+    """
+    global _memory_manager
+    with _memory_manager_lock:
+        manager, _memory_manager = _memory_manager, None
+    
+    if manager is not None and manager.client is not None:
+        try:
+            manager.client.close()
+        except Exception:
+            pass
+
+
+def warm_memory_manager() -> None:
+    """
+    Connects to Weaviate and runs a throwaway search.
+    
+    Vectors are computed by Weaviate's text2vec module, so the first
+    near_text query also warms the vectorizer path before real traffic.
+    """
+    manager = get_memory_manager()
+    if manager.client:
+        manager.search_memories("warmup", agent_id="__warmup__", limit=1)
+
+
+Scope = Tuple[str, Optional[str], int]  # (agent_id, memory_type, limit)
+
+
+def _query_terms(query: str) -> Tuple[str, ...]:
+    """
+    Normalizes a query to its lowercase word terms, in order.
+    
+    Case, punctuation and spacing variants share a search cache entry;
+    reordered or reworded queries ("dog bites man" vs "man bites dog") do
+    not, since Weaviate may rank them differently.
+    """
+    return tuple(re.findall(r"\w+", query.casefold()))
+
+
+# search_memory results keyed by (scope, query terms)
+_search_cache: LRUCache[Tuple[Scope, Tuple[str, ...]], List[Dict[str, Any]]] = LRUCache(
+    maxsize=int(os.getenv("CHIMERA_SEARCH_CACHE_MAX", "1024")),
+    ttl=float(os.getenv("CHIMERA_SEARCH_CACHE_TTL", "300"))
+)
+
+
+def _copy_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copies search results so callers and the cache never share mutable dicts."""
+    return [dict(result) for result in results]
+
+
+# Upper bound on memories returned by a single tool or resource call
+MAX_RESULTS = 100
+
+# Assembled contexts keyed by (agent_id, input_query)
+CONTEXT_CACHE_TTL = 60.0  # seconds
+CONTEXT_CACHE_MAXSIZE = 256
+_context_cache: LRUCache[Tuple[str, str], str] = LRUCache(
+    maxsize=CONTEXT_CACHE_MAXSIZE, ttl=CONTEXT_CACHE_TTL
+)
+
+
 @mcp.resource("memory://agent/{agent_id}/recent")
 def get_recent_memories(agent_id: str) -> str:
     """
@@ -34,15 +134,35 @@ def get_recent_memories(agent_id: str) -> str:
     Args:
         agent_id: Agent identifier
     """
+    return get_recent_memories_page(agent_id, limit=10, offset=0)
+
+
+@mcp.resource("memory://agent/{agent_id}/recent/{limit}/{offset}")
+def get_recent_memories_page(agent_id: str, limit: int, offset: int) -> str:
+    """
+    Resource: Returns one page of recent memories for an agent.
+    
+    Args:
+        agent_id: Agent identifier
+        limit: Maximum number of memories in the page
+        offset: Number of memories to skip
+    """
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    
+    limit = min(limit, MAX_RESULTS)
     manager = get_memory_manager()
-    memories = manager.search_memories(
+    memories = manager.search_memories_iter(
         query="recent interactions",
         agent_id=agent_id,
-        limit=10,
+        limit=offset + limit,
         memory_type="episodic"
     )
     
-    return "\n".join([f"- {m.content[:100]}..." for m in memories])
+    page = "\n".join(f"- {m.content[:100]}..." for m in islice(memories, offset, None))
+    return page or "(no recent memories)"
 
 
 @mcp.tool()
@@ -61,15 +181,21 @@ def search_memory(
         limit: Maximum results
         memory_type: Filter by type (optional)
     """
+    limit = min(limit, MAX_RESULTS)
+    key = ((agent_id, memory_type, limit), _query_terms(query))
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return _copy_results(cached)
+    
     manager = get_memory_manager()
-    memories = manager.search_memories(
+    memories = manager.search_memories_iter(
         query=query,
         agent_id=agent_id,
         limit=limit,
         memory_type=memory_type
     )
     
-    return [
+    results = [
         {
             "content": m.content,
             "timestamp": m.timestamp.isoformat(),
@@ -78,6 +204,11 @@ def search_memory(
         }
         for m in memories
     ]
+    
+    # search_memories also returns [] on errors, so only cache real hits
+    if results:
+        _search_cache.set(key, _copy_results(results))
+    return results
 
 
 @mcp.tool()
@@ -103,6 +234,9 @@ def store_memory(
         memory_type=memory_type,
         importance_score=importance_score
     )
+    # Drop every cached search and context for this agent
+    _search_cache.discard_where(lambda key: key[0][0] == agent_id)
+    _context_cache.discard_where(lambda key: key[0] == agent_id)
     
     return {
         "status": "success",
@@ -112,17 +246,48 @@ def store_memory(
 
 
 @mcp.tool()
-def assemble_context(agent_id: str, input_query: str) -> str:
+def assemble_context(agent_id: str, input_query: str, max_chars: int = 8000, offset: int = 0) -> str:
     """
     Tool: Assembles context for LLM injection.
     
+    Long contexts are returned in pages of at most max_chars characters;
+    a truncation marker gives the offset to request the next page.
+    
     Args:
         agent_id: Agent identifier
         input_query: Current input query
+        max_chars: Maximum characters to return
+        offset: Character offset to start from (for paging)
     """
-    manager = get_memory_manager()
-    return manager.assemble_context(agent_id, input_query)
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    
+    key = (agent_id, input_query)
+    context = _context_cache.get(key)
+    if context is None:
+        manager = get_memory_manager()
+        context = manager.assemble_context(agent_id, input_query)
+        # Searches also come back empty while Weaviate is down, so like
+        # search_memory only cache contexts that found long-term memories
+        if NO_LONG_TERM_MEMORIES not in context:
+            _context_cache.set(key, context)
+    
+    end = offset + max_chars
+    page = context[offset:end]
+    if end < len(context):
+        page += f"\n...[truncated, call with offset={end} for more]"
+    return page
+
+
+def main() -> None:
+    """Runs the server, closing the process-wide Weaviate client on exit."""
+    try:
+        mcp.run()
+    finally:
+        reset_memory_manager()
 
 
 if __name__ == "__main__":
-    mcp.run()
+    main()
@@ -3,5 +3,15 @@ import os
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    print(f"Starting Chimera Orchestrator on port {port}...")
-    uvicorn.run("chimera.api.main:app", host="0.0.0.0", port=port, reload=True)
+    environment = os.getenv("ENVIRONMENT", "development")
+    print(f"Starting Chimera Orchestrator on port {port} ({environment})...")
+
+    if environment == "development":
+        # Auto-reload is single-process and watches the filesystem; dev only
+        uvicorn.run("chimera.api.main:app", host="0.0.0.0", port=port, reload=True)
+    else:
+        # uvicorn picks uvloop/httptools automatically when installed (see the "perf" extra)
+        # The HITL review queue (chimera/api/routes/hitl.py) lives in process
+        # memory, so more than one worker splits it; opt in via WEB_CONCURRENCY
+        workers = int(os.getenv("WEB_CONCURRENCY", 1))
+        uvicorn.run("chimera.api.main:app", host="0.0.0.0", port=port, workers=workers)
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from chimera.agents.planner import PlannerAgent
+from chimera.mcp.client import SkillExecutorPool
 from dotenv import load_dotenv
 
 # Configure logging to show info
@@ -34,6 +35,8 @@ async def main():
             
     except Exception as e:
         print(f"❌ CRITICAL ERROR: {e}")
+    finally:
+        await SkillExecutorPool.close_all()
 
 if __name__ == "__main__":
     asyncio.run(main())
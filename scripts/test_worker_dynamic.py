@@ -4,7 +4,7 @@ Test script for Dynamic Worker Agent.
 import asyncio
 import logging
 import os
-from chimera.agents.worker import WorkerAgent
+from chimera.agents.worker import WorkerPool
 from chimera.core.models import Task, TaskType, TaskContext, TaskPriority
 from dotenv import load_dotenv
 
@@ -20,9 +20,16 @@ async def test_dynamic_worker():
     image_server = os.path.join(base_path, "image_server.py")
     social_server = os.path.join(base_path, "social_server.py")
     
+    # One long-lived MCP session per server, shared by every worker
+    pool = WorkerPool()
+    try:
+        await run_test_cases(pool, image_server, social_server)
+    finally:
+        await pool.aclose()
+
+async def run_test_cases(pool: WorkerPool, image_server: str, social_server: str):
     # Test Case 1: Image Generation
-    print("\n--- Test Case 1: Image Generation (using image_server) ---")
-    worker_image = WorkerAgent(server_script_path=image_server)
+    worker_image = await pool.get(image_server)
     
     task1 = Task(
         task_id="test-1",
@@ -34,13 +41,8 @@ async def test_dynamic_worker():
         )
     )
     
-    result1 = await worker_image.execute_task(task1)
-    print(f"Result 1 Status: {result1.status}")
-    print(f"Result 1 Output: {result1.output}")
-    
     # Test Case 2: Social Post
-    print("\n--- Test Case 2: Social Post (using social_server) ---")
-    worker_social = WorkerAgent(server_script_path=social_server)
+    worker_social = await pool.get(social_server)
     
     task2 = Task(
         task_id="test-2",
@@ -52,7 +54,17 @@ async def test_dynamic_worker():
         )
     )
     
-    result2 = await worker_social.execute_task(task2)
+    # The tasks target different servers and share no state, so run them together
+    result1, result2 = await asyncio.gather(
+        worker_image.execute_task(task1),
+        worker_social.execute_task(task2)
+    )
+    
+    print("\n--- Test Case 1: Image Generation (using image_server) ---")
+    print(f"Result 1 Status: {result1.status}")
+    print(f"Result 1 Output: {result1.output}")
+    
+    print("\n--- Test Case 2: Social Post (using social_server) ---")
     print(f"Result 2 Status: {result2.status}")
     print(f"Result 2 Output: {result2.output}")
 
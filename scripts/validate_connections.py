@@ -52,8 +52,7 @@ async def validate_redis():
         logger.error(f"❌ Redis Connection failed: {e}")
         return False
 
-async def validate_weaviate():
-    logger.info("--- Validating Weaviate ---")
+def _check_weaviate() -> bool:
     w = MemoryManager() # Uses env vars
     if w.client and w.client.is_live():
         logger.info("✅ Weaviate Connection successful.")
@@ -64,13 +63,24 @@ async def validate_weaviate():
         if w.client: w.client.close()
         return False
 
+async def validate_weaviate():
+    logger.info("--- Validating Weaviate ---")
+    # The Weaviate client is synchronous; keep it off the loop so the
+    # Postgres and Redis checks can proceed in the meantime.
+    return await asyncio.to_thread(_check_weaviate)
+
 async def main():
     print("Beginning Connection Validation Code...")
-    pg_ok = await validate_postgres()
-    redis_ok = await validate_redis()
-    weaviate_ok = await validate_weaviate()
+    # Checks are independent, so run them concurrently
+    results = await asyncio.gather(
+        validate_postgres(), validate_redis(), validate_weaviate(),
+        return_exceptions=True
+    )
+    for name, result in zip(("PostgreSQL", "Redis", "Weaviate"), results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ {name} check raised: {result}")
     
-    if pg_ok and redis_ok and weaviate_ok:
+    if all(result is True for result in results):
         print("\n🎉 ALL SYSTEMS GO! Production services are reachable.")
         exit(0)
     else:
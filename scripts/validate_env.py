@@ -6,8 +6,9 @@ Validates that all required environment variables are set and services are acces
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -214,6 +215,25 @@ def check_optional_vars() -> List[ValidationResult]:
     return results
 
 
+def check_services() -> List[ValidationResult]:
+    """
+    Probes external services concurrently.
+    
+    Each probe blocks on network I/O with its own timeout, so running them in
+    threads bounds the wait by the slowest probe instead of their sum.
+    """
+    checks = [check_redis, check_weaviate, check_coinbase]
+    results: List[Optional[ValidationResult]] = [None] * len(checks)
+    
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {executor.submit(check): i for i, check in enumerate(checks)}
+        for future in as_completed(futures):
+            # Slot results by check order so output is stable between runs
+            results[futures[future]] = future.result()
+    
+    return results
+
+
 def main():
     """Main validation function."""
     print("🔍 Validating Project Chimera Environment Setup\n")
@@ -234,9 +254,7 @@ def main():
     # Check service connections
     print("\n🔌 Service Connections:")
     print("-" * 60)
-    all_results.append(check_redis())
-    all_results.append(check_weaviate())
-    all_results.append(check_coinbase())
+    all_results.extend(check_services())
     
     # Print all results
     print("\n📊 Validation Results:")
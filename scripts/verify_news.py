@@ -1,9 +1,12 @@
+import asyncio
 from chimera.mcp.servers.news_server import get_latest_news, read_feed
+from chimera.core.perception import NewsIngester
 
-def test_news_fetching():
+async def test_news_fetching():
     print("Testing 'news://latest' resource...")
+    news = ""
     try:
-        news = get_latest_news()
+        news = await get_latest_news()
         print("\n--- Latest News ---")
         print(news)
         print("-------------------\n")
@@ -13,23 +16,18 @@ def test_news_fetching():
     print("Testing 'read_feed' tool (BBC Technology)...")
     try:
         bs_url = "http://feeds.bbci.co.uk/news/technology/rss.xml"
-        feed_content = read_feed(bs_url, limit=3)
+        feed_content = await read_feed(bs_url, limit=3)
         print("\n--- BBC Tech Feed ---")
         print(feed_content)
         print("---------------------\n")
     except Exception as e:
          print(f"FAILED to read feed: {e}")
 
-    except Exception as e:
-         print(f"FAILED to read feed: {e}")
-
     print("Testing NewsIngester integration...")
     try:
-        from chimera.core.perception import NewsIngester
-        ingester = NewsIngester()
-        # reusing 'news' from the first test
-        if 'news' in locals() and news:
-            items = ingester.parse_mcp_news_response(news)
+        # Parse the headlines fetched above once, rather than fetching again
+        if news:
+            items = NewsIngester().parse_mcp_news_response(news)
             print(f"Parsed {len(items)} items.")
             if items:
                 print(f"Sample Item: {items[0]}")
@@ -41,4 +39,5 @@ def test_news_fetching():
         print(f"Integration Test FAILED: {e}")
 
 if __name__ == "__main__":
-    test_news_fetching()
+    # One event loop for every check, so feed fetches share the HTTP client
+    asyncio.run(test_news_fetching())
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import pytest
+import pytest_asyncio
+from chimera.mcp.client import SkillExecutor
+
+try:
+    import uvloop
+except ImportError:  # Optional: installed with the 'perf' extra
+    uvloop = None
+
+NEWS_SERVER_PATH = os.path.abspath("chimera/mcp/servers/news_server.py")
+
+SOUL_CONTENT = """---
+name: "Test Agent"
+agent_id: "test-agent-v1"
+voice_traits:
+  - "Witty"
+  - "Technical"
+core_beliefs:
+  - "Open source"
+directives:
+  - "NEVER discuss politics"
+---
+# Backstory
+
+This is a test agent created for testing purposes.
+"""
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Runs async tests on uvloop; without it the default loop is used."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def soul_file(tmp_path_factory):
+    """
+    A SOUL.md written once per session.
+
+    Treat it as read-only; tests that modify it should shutil.copy it into
+    their own tmp_path first.
+    """
+    path = tmp_path_factory.mktemp("persona") / "SOUL.md"
+    path.write_text(SOUL_CONTENT)
+    return path
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_executor():
+    """
+    One news MCP server subprocess shared by every test in the session.
+
+    The stdio session must be closed by the task that opened it, and fixture
+    setup and teardown run in different tasks, so a dedicated task owns it.
+    """
+    executor = SkillExecutor(server_script_path=NEWS_SERVER_PATH)
+    ready = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def own_session():
+        await executor.initialize()
+        try:
+            ready.set()
+            await finished.wait()
+        finally:
+            await executor.cleanup()
+
+    owner = asyncio.create_task(own_session())
+    ready_wait = asyncio.create_task(ready.wait())
+    await asyncio.wait({owner, ready_wait}, return_when=asyncio.FIRST_COMPLETED)
+    if owner.done():
+        ready_wait.cancel()
+        owner.result()  # Surface the initialization error
+
+    yield executor
+
+    finished.set()
+    await owner
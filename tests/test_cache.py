@@ -0,0 +1,44 @@
+"""
+Tests for the shared in-process LRU cache.
+"""
+from unittest.mock import patch
+from chimera.core import cache as cache_module
+from chimera.core.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    """A lookup refreshes an entry, so the untouched one is evicted first."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_expires_entries():
+    """Entries older than the TTL are treated as missing and dropped."""
+    cache = LRUCache(maxsize=4, ttl=10)
+    with patch.object(cache_module.time, "monotonic", side_effect=[100.0, 105.0, 111.0]):
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("a", "missing") == "missing"
+
+    assert len(cache) == 0
+
+
+def test_discard_where_and_pop():
+    """Entries can be dropped by key predicate or individually."""
+    cache = LRUCache(maxsize=8)
+    for key in [("zara", 1), ("zara", 2), ("kai", 1)]:
+        cache.set(key, key[1])
+
+    assert cache.discard_where(lambda key: key[0] == "zara") == 2
+    assert cache.pop(("kai", 1)) == 1
+    assert cache.pop(("kai", 1), "gone") == "gone"
+    assert len(cache) == 0
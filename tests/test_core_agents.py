@@ -1,11 +1,15 @@
+import asyncio
 import pytest
 from chimera.agents.judge import JudgeAgent
 from chimera.core.models import TaskResult, TaskStatus, Verdict
-import uuid
 
 # --- Judge Agent Tests (Paramterized) ---
 
-@pytest.mark.parametrize("confidence,expected_verdict", [
+# The judge never reads task_id, so a fixed id avoids a uuid4() per case
+_TASK_ID = "00000000-0000-0000-0000-000000000000"
+
+# Every threshold case, checked in one batch call
+JUDGE_THRESHOLD_CASES = [
     (0.95, Verdict.APPROVE),
     (0.91, Verdict.APPROVE),
     (0.90, Verdict.APPROVE), # Boundary condition
@@ -16,18 +20,39 @@ import uuid
     (0.50, Verdict.REJECT),
     (0.10, Verdict.REJECT),
     (0.00, Verdict.REJECT),
-])
+]
+
+def test_judge_batch_verdict_thresholds():
+    """
+    Verifies that the Judge maps a whole batch of confidence scores to verdicts.
+    """
+    confidences = [confidence for confidence, _ in JUDGE_THRESHOLD_CASES]
+    expected = [verdict for _, verdict in JUDGE_THRESHOLD_CASES]
+    assert JudgeAgent().evaluate_batch(confidences) == expected
+
+# evaluate() shares its thresholds with evaluate_batch(); check each branch's boundary
+JUDGE_SINGLE_CASES = [
+    (0.90, Verdict.APPROVE), # Boundary condition
+    (0.70, Verdict.ESCALATE), # Boundary condition
+    (0.69, Verdict.REJECT),
+]
+
+@pytest.mark.parametrize(
+    "confidence,expected_verdict",
+    JUDGE_SINGLE_CASES,
+    ids=[f"{c:.2f}" for c, _ in JUDGE_SINGLE_CASES]
+)
 def test_judge_verdict_thresholds(confidence, expected_verdict):
     """
     Verifies that the Judge correctly correctly maps confidence scores to verdicts.
     """
     judge = JudgeAgent()
-    result = TaskResult(
-        task_id=str(uuid.uuid4()),
+    # Only confidence_score matters to the judge; skip model validation
+    result = TaskResult.model_construct(
+        task_id=_TASK_ID,
         worker_id="worker-test-01",
         output={"summary": "Test Content"},
         status=TaskStatus.COMPLETE,
-        result="Test Content", # Note: This field 'result' seems to be a mismatch with the model definition which uses 'output'. The model definition has 'output' which is a Dict. The test was passing string to 'result'. Wait, looking at models.py again.
         confidence_score=confidence
     )
     decision = judge.evaluate(result)
@@ -49,11 +74,17 @@ def test_judge_sensitive_content(content, needs_review):
 
 # --- Planner Agent Tests ---
 
-@pytest.mark.parametrize("goal_type,expected_task_count", [
+PLANNER_CASES = [
     ("simple_trend", 1),
     ("complex_campaign", 2), 
     ("multi_step_workflow", 3),
-])
+]
+
+@pytest.mark.parametrize(
+    "goal_type,expected_task_count",
+    PLANNER_CASES,
+    ids=[goal_type for goal_type, _ in PLANNER_CASES]
+)
 def test_planner_decomposition(goal_type, expected_task_count):
     """
     Tests the planner's ability to break down goals (Mocked Logic).
@@ -63,15 +94,97 @@ def test_planner_decomposition(goal_type, expected_task_count):
 
 # --- Worker Agent Tests ---
 
-@pytest.mark.parametrize("task_type", [
+WORKER_TASK_TYPES = [
     "fetch_trends",
     "generate_image",
     "post_tweet",
     "analyze_sentiment",
     "summarize_article"
-])
+]
+
+@pytest.mark.parametrize("task_type", WORKER_TASK_TYPES, ids=WORKER_TASK_TYPES)
 def test_worker_identifies_task(task_type):
     """
     Verifies worker accepts supported task types.
     """
     assert True
+
+@pytest.mark.asyncio
+async def test_pooled_workers_share_session_and_keep_it_open():
+    """
+    Verifies that WorkerPool workers reuse one MCP session and never tear it down per task.
+    """
+    from unittest.mock import AsyncMock, patch
+    from chimera.agents.worker import WorkerPool
+    from chimera.core.models import Task, TaskType, TaskContext
+    from chimera.mcp.client import SkillExecutor, SkillExecutorPool
+
+    pool = WorkerPool()
+    with patch.object(SkillExecutor, "initialize", AsyncMock()) as mock_init, \
+         patch.object(SkillExecutor, "cleanup", AsyncMock()) as mock_cleanup, \
+         patch.object(SkillExecutor, "list_tools", AsyncMock(side_effect=RuntimeError("no llm in tests"))):
+        try:
+            worker_a = await pool.get("chimera/mcp/servers/social_server.py")
+            worker_b = await pool.get("chimera/mcp/servers/social_server.py")
+            task = Task(task_type=TaskType.SOCIAL_ACTION, context=TaskContext(goal_description="Say hi"))
+            await worker_a.execute_task(task)
+
+            assert worker_a.worker_id != worker_b.worker_id
+            assert worker_a.skill_executor is worker_b.skill_executor
+            assert mock_init.await_count == 1
+            assert mock_cleanup.await_count == 0
+        finally:
+            await pool.aclose()
+            await SkillExecutorPool.close_all()
+
+    assert mock_cleanup.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_leaves_other_sessions_open():
+    """
+    Verifies that closing a WorkerPool does not shut down sessions it did not start.
+    """
+    from unittest.mock import AsyncMock, patch
+    from chimera.agents.worker import WorkerPool
+    from chimera.mcp.client import SkillExecutor, SkillExecutorPool
+
+    with patch.object(SkillExecutor, "initialize", AsyncMock()), \
+         patch.object(SkillExecutor, "cleanup", AsyncMock()) as mock_cleanup:
+        try:
+            # e.g. the planner's news session, opened before the pool
+            planner_news = await SkillExecutorPool.get("chimera/mcp/servers/news_server.py")
+
+            pool = WorkerPool()
+            worker_news = await pool.get("chimera/mcp/servers/news_server.py")
+            await pool.get("chimera/mcp/servers/social_server.py")
+            await pool.aclose()
+
+            assert worker_news.skill_executor is planner_news
+            assert mock_cleanup.await_count == 1  # only the social session
+            assert SkillExecutorPool.running("chimera/mcp/servers/news_server.py") is planner_news
+            assert SkillExecutorPool.running("chimera/mcp/servers/social_server.py") is None
+        finally:
+            await SkillExecutorPool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_closes_from_another_task(caplog):
+    """
+    Verifies that a WorkerPool started in one task can be closed from another.
+    """
+    import logging
+    from chimera.agents.worker import WorkerPool
+    from chimera.mcp.client import SkillExecutorPool
+
+    news_server = "chimera/mcp/servers/news_server.py"
+    pool = WorkerPool()
+    try:
+        worker = await asyncio.create_task(pool.get(news_server))
+        assert await worker.skill_executor.list_tools()
+
+        await asyncio.create_task(pool.aclose())
+        assert SkillExecutorPool.running(news_server) is None
+        assert not [r for r in caplog.records if r.name == "chimera.mcp.client" and r.levelno >= logging.WARNING]
+    finally:
+        await SkillExecutorPool.close_all()
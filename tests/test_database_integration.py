@@ -1,13 +1,34 @@
 
 import pytest
+import pytest_asyncio
 import os
+import uuid
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from chimera.core.database import DatabaseManager, Campaign, CampaignStatus
 
-# Mark as integration test
-pytestmark = pytest.mark.asyncio
+# Mark as integration test; all tests share the session loop the pool lives on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
+# Set by pytest-xdist ("gw0", "gw1", ...); absent in a serial run
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+def _use_worker_schema(engine, schema: str):
+    """Points every pooled connection at a private schema, creating it on first use."""
+    @event.listens_for(engine.sync_engine, "connect", insert=True)
+    def set_search_path(dbapi_connection, connection_record):
+        # Autocommit, so the pool's reset-on-return cannot roll the SET back
+        existing_autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+        cursor.execute(f'SET SESSION search_path TO "{schema}"')
+        cursor.close()
+        dbapi_connection.autocommit = existing_autocommit
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def db_manager():
+    """Connects and initializes the schema once for the whole test session."""
     # Allow override for test DB
     url = os.getenv("POSTGRES_TEST_URL", os.getenv("POSTGRES_URL"))
     if not url:
@@ -16,6 +37,9 @@ async def db_manager():
     manager = DatabaseManager(url)
     try:
         await manager.connect()
+        if manager.engine is not None and XDIST_WORKER != "master":
+            # Parallel workers share the database; give each its own tables
+            _use_worker_schema(manager.engine, f"chimera_test_{XDIST_WORKER}")
         # Initialize schema for test
         await manager.init_db()
     except Exception as e:
@@ -25,43 +49,63 @@ async def db_manager():
     yield manager
     await manager.disconnect()
 
-async def test_campaign_crud(db_manager):
-    """Test creating and retrieving a campaign."""
-    async with db_manager.session_factory() as session:
-        # Create
-        campaign = Campaign(
-            goal_description="Integration Test Campaign",
-            status=CampaignStatus.ACTIVE,
-            budget_limit=100.0
-        )
-        
-        # We need to map Pydantic model to SQLAlchemy ORM if we were using full ORM
-        # simpler validation: usage with raw sql or minimal wrapper for now 
-        # since we haven't defined full SQLAlchemy ORM mapped classes in `models.py` yet
-        # checking implementation in database.py shows we initialized tables via raw SQL.
-        
-        # Let's insert via raw SQL for this integration test since ORM mappings aren't fully set up in the snippet
-        from sqlalchemy import text
-        
-        await session.execute(
-            text("INSERT INTO campaigns (id, goal_description, status, budget_limit) VALUES (:id, :goal, :status, :budget)"),
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(db_manager):
+    """
+    Session inside a transaction that is rolled back after the test.
+    
+    Commits made by the test only release a SAVEPOINT, so no rows outlive
+    the test and no cleanup SQL is needed.
+    """
+    async with db_manager.engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+@pytest.mark.parametrize("n_rows", [1, 100, 1000])
+async def test_campaign_crud(db_session, n_rows):
+    """Test batch-creating and retrieving campaigns."""
+    # Create
+    goal = f"Integration Test Campaign {uuid.uuid4()}"
+    campaigns = [
+        Campaign(goal_description=goal, status=CampaignStatus.ACTIVE, budget_limit=100.0)
+        for _ in range(n_rows)
+    ]
+    
+    # We need to map Pydantic model to SQLAlchemy ORM if we were using full ORM
+    # simpler validation: usage with raw sql or minimal wrapper for now 
+    # since we haven't defined full SQLAlchemy ORM mapped classes in `models.py` yet
+    # checking implementation in database.py shows we initialized tables via raw SQL.
+    
+    # Let's insert via raw SQL for this integration test since ORM mappings aren't fully set up in the snippet.
+    # A list of parameter sets runs as one asyncpg executemany, not one round-trip per row.
+    from sqlalchemy import text
+    
+    await db_session.execute(
+        text("INSERT INTO campaigns (id, goal_description, status, budget_limit) VALUES (:id, :goal, :status, :budget)"),
+        [
             {
                 "id": campaign.id,
                 "goal": campaign.goal_description,
                 "status": campaign.status.value,
                 "budget": campaign.budget_limit
             }
-        )
-        await session.commit()
-        
-        # Read
-        result = await session.execute(
-            text("SELECT * FROM campaigns WHERE id = :id"),
-            {"id": campaign.id}
-        )
-        row = result.fetchone()
-        
-        assert row is not None
-        assert row.goal_description == "Integration Test Campaign"
-        assert float(row.budget_limit) == 100.0
-
+            for campaign in campaigns
+        ]
+    )
+    await db_session.commit()
+    
+    # Read
+    result = await db_session.execute(
+        text("SELECT * FROM campaigns WHERE goal_description = :goal"),
+        {"goal": goal}
+    )
+    rows = result.fetchall()
+    
+    assert len(rows) == n_rows
+    assert {str(row.id) for row in rows} == {campaign.id for campaign in campaigns}
+    assert all(float(row.budget_limit) == 100.0 for row in rows)
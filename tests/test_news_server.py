@@ -0,0 +1,145 @@
+import pytest
+import asyncio
+import time
+import feedparser
+import httpx
+from unittest.mock import patch
+from chimera.mcp.servers import news_server
+from chimera.mcp.servers.news_server import get_latest_news
+
+SAMPLE_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Sample Feed</title>
+<item><title>First Story</title><link>https://example.com/1</link></item>
+<item><title>Second Story</title><link>https://example.com/2</link></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_latest_news_fetches_sources_concurrently():
+    """Test that all default feeds are fetched in parallel, not one after another."""
+    async def slow_fetch(url):
+        await asyncio.sleep(0.2)
+        return feedparser.parse(SAMPLE_RSS)
+
+    with patch.object(news_server, "fetch_and_parse", side_effect=slow_fetch):
+        start = time.perf_counter()
+        news = await get_latest_news()
+        duration = time.perf_counter() - start
+
+    assert duration < 0.2 * len(news_server.DEFAULT_FEEDS)
+    assert "- [TECHCRUNCH] First Story (https://example.com/1)" in news
+    assert "- [WIRED] Second Story (https://example.com/2)" in news
+
+
+@pytest.mark.asyncio
+async def test_latest_news_reports_failed_source():
+    """Test that one failing feed does not block the other sources."""
+    async def flaky_fetch(url):
+        if url == news_server.DEFAULT_FEEDS["hackernews"]:
+            raise ConnectionError("boom")
+        return feedparser.parse(SAMPLE_RSS)
+
+    with patch.object(news_server, "fetch_and_parse", side_effect=flaky_fetch):
+        news = await get_latest_news()
+
+    assert "- [HACKERNEWS] Error: Could not fetch feed" in news
+    assert "- [TECHCRUNCH] First Story (https://example.com/1)" in news
+
+
+def _mock_client(handler):
+    """Builds an HTTP client whose requests are answered by handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_read_feed_is_cached_within_ttl():
+    """Test that repeated reads of the same feed only hit the network once."""
+    news_server._feed_cache.clear()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=SAMPLE_RSS)
+
+    with patch.object(news_server, "get_http_client", return_value=_mock_client(handler)):
+        first = await news_server.read_feed("https://example.com/rss", limit=1)
+        second = await news_server.read_feed("https://example.com/rss", limit=1)
+
+    assert first == second
+    assert "Feed: Sample Feed" in first
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_feed_revalidates_with_etag_after_ttl():
+    """Test that expired entries are revalidated and a 304 reuses the cached feed."""
+    news_server._feed_cache.clear()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=SAMPLE_RSS, headers={"ETag": '"v1"'})
+
+    with patch.object(news_server, "get_http_client", return_value=_mock_client(handler)), \
+         patch.object(news_server.feedparser, "parse", wraps=feedparser.parse) as mock_parse:
+        await news_server.read_feed("https://example.com/rss")
+        cached = news_server._feed_cache.get("https://example.com/rss")
+        news_server._feed_cache.set("https://example.com/rss", cached._replace(
+            fetched_at=-news_server.FEED_CACHE_TTL  # Force expiry
+        ))
+        result = await news_server.read_feed("https://example.com/rss")
+
+    assert "- First Story: https://example.com/1" in result
+    assert len(requests) == 2
+    assert mock_parse.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_read_feed_keeps_validators_across_revalidations():
+    """Test that a 304 without validators keeps the cached ETag/Last-Modified for the next check."""
+    news_server._feed_cache.clear()
+    sent = []
+
+    def handler(request):
+        sent.append((request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)  # No validators repeated, as most servers do
+        return httpx.Response(200, content=SAMPLE_RSS, headers={
+            "ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"
+        })
+
+    def expire():
+        cached = news_server._feed_cache.get("https://example.com/rss")
+        news_server._feed_cache.set("https://example.com/rss", cached._replace(
+            fetched_at=-news_server.FEED_CACHE_TTL
+        ))
+
+    with patch.object(news_server, "get_http_client", return_value=_mock_client(handler)), \
+         patch.object(news_server.feedparser, "parse", wraps=feedparser.parse) as mock_parse:
+        await news_server.read_feed("https://example.com/rss")
+        expire()
+        await news_server.read_feed("https://example.com/rss")
+        expire()
+        result = await news_server.read_feed("https://example.com/rss")
+
+    validators = ('"v1"', "Wed, 01 Jan 2025 00:00:00 GMT")
+    assert sent == [(None, None), validators, validators]
+    assert "- First Story: https://example.com/1" in result
+    assert mock_parse.call_count == 1
+
+
+def test_http_client_is_closed_with_its_event_loop():
+    """Each loop gets its own client, closed when that loop shuts down."""
+    async def use_client():
+        client = news_server.get_http_client()
+        assert news_server.get_http_client() is client
+        return client
+
+    first = asyncio.run(use_client())
+    assert first.is_closed
+
+    second = asyncio.run(use_client())
+    assert second is not first
+    assert second.is_closed
@@ -3,33 +3,19 @@ Tests for SOUL.md Persona System.
 
 Verifies persona loading, validation, and system prompt generation.
 """
+import re
+
 from chimera.core.persona import AgentPersona
 
+# Persona elements the system prompt must mention, matched in one pass
+PROMPT_NEEDLES = ("Zara", "Fashion influencer", "Witty", "Sustainability", "NEVER give financial advice")
+PROMPT_NEEDLE_PATTERN = re.compile("|".join(map(re.escape, PROMPT_NEEDLES)))
+
 
-def test_persona_from_soul_file(tmp_path):
+def test_persona_from_soul_file(soul_file):
     """
     Verifies that a persona can be loaded from a SOUL.md file.
     """
-    # Create a test SOUL.md file
-    soul_content = """---
-name: "Test Agent"
-agent_id: "test-agent-v1"
-voice_traits:
-  - "Witty"
-  - "Technical"
-core_beliefs:
-  - "Open source"
-directives:
-  - "NEVER discuss politics"
----
-# Backstory
-
-This is a test agent created for testing purposes.
-"""
-    
-    soul_file = tmp_path / "SOUL.md"
-    soul_file.write_text(soul_content)
-    
     # Load persona
     persona = AgentPersona.from_soul_file(soul_file)
     
@@ -76,8 +62,6 @@ def test_persona_system_prompt():
     
     prompt = persona.to_system_prompt()
     
-    assert "Zara" in prompt
-    assert "Fashion influencer" in prompt
-    assert "Witty" in prompt
-    assert "Sustainability" in prompt
-    assert "NEVER give financial advice" in prompt
+    found = set(PROMPT_NEEDLE_PATTERN.findall(prompt))
+    missing = set(PROMPT_NEEDLES) - found
+    assert not missing, f"System prompt is missing: {sorted(missing)}"
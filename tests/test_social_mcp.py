@@ -1,6 +1,7 @@
 
 import pytest
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
 from chimera.mcp.servers.social_server import post_content, get_mentions, reply_to_mention
 
 @pytest.mark.asyncio
@@ -35,3 +36,79 @@ async def test_reply_flow():
     result = await reply_to_mention("twitter", "mention_123", "Sure thing!")
     assert result["status"] == "success"
     assert result["in_reply_to"] == "mention_123"
+
+def test_adapter_registry_is_case_insensitive_and_shared():
+    """Test that platform lookup ignores case and aliases share one adapter."""
+    from chimera.mcp.servers.social_server import Platform, _ADAPTERS, get_adapter
+    assert get_adapter("X") is get_adapter("twitter") is _ADAPTERS[Platform.TWITTER]
+    assert get_adapter("Instagram") is get_adapter("instagram")
+    with pytest.raises(ValueError, match="Unsupported platform"):
+        get_adapter("myspace")
+
+@pytest.mark.asyncio
+async def test_execute_social_batch():
+    """Test that batched ops run independently and report per-op status."""
+    from chimera.mcp.servers.social_server import execute_social_batch
+    results = await execute_social_batch([
+        {"op": "post_content", "platform": "twitter", "content": "Hello!"},
+        {"op": "post_content", "platform": "instagram", "content": "No pic"},
+        {"op": "reply_to_mention", "platform": "x", "mention_id": "mention_123", "content": "Thanks!"},
+        {"op": "get_mentions", "platform": "myspace"},
+        {"op": "reply_to_mention", "platform": "twitter"},
+    ])
+
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["status"] for r in results] == ["success", "error", "success", "error", "error"]
+    assert "tweet_" in results[0]["result"]["id"]
+    assert "media" in results[1]["error"]
+    assert results[2]["result"]["in_reply_to"] == "mention_123"
+    assert "Unsupported platform" in results[3]["error"]
+    assert "Missing argument" in results[4]["error"]
+
+@pytest.mark.asyncio
+async def test_execute_social_batch_rejects_malformed_ops():
+    """Test that unknown ops and wrongly typed arguments fail only their own entry."""
+    from chimera.mcp.servers.social_server import execute_social_batch
+    results = await execute_social_batch([
+        {"op": "delete_account", "platform": "twitter"},
+        {"op": "post_content", "platform": "twitter", "content": 42},
+        {"op": "get_mentions", "platform": "twitter"},
+    ])
+
+    assert [r["status"] for r in results] == ["error", "error", "success"]
+    assert "Unsupported op: delete_account" in results[0]["error"]
+    assert "Invalid argument 'content'" in results[1]["error"]
+
+@pytest.mark.asyncio
+async def test_post_content_reports_progress():
+    """Test that posting reports dispatch and acknowledgement progress to the client."""
+    ctx = MagicMock()
+    ctx.report_progress = AsyncMock()
+
+    result = await post_content("twitter", "Hello!", ctx=ctx)
+
+    assert result["status"] == "success"
+    assert [c.args[0] for c in ctx.report_progress.call_args_list] == [0.1, 1.0]
+
+@pytest.mark.asyncio
+async def test_progress_failure_does_not_fail_delivered_post():
+    """Test that a lost progress notification is not reported as a failed post."""
+    from chimera.mcp.servers import social_server
+    ctx = MagicMock()
+    ctx.report_progress = AsyncMock(side_effect=[None, ConnectionError("client went away")])
+
+    with patch.object(social_server.MockTwitterAdapter, "post_content", AsyncMock(
+        return_value={"platform": "twitter", "status": "success", "id": "tweet_1"}
+    )) as mock_post:
+        result = await post_content("twitter", "Hello!", ctx=ctx)
+
+    assert result["status"] == "success"
+    assert mock_post.await_count == 1
+
+def test_cached_now_iso_rebuilds_once_per_second():
+    """Test that the mention timestamp is reused within a second and refreshed after."""
+    from chimera.mcp.servers import social_server
+    with patch.object(social_server.time, "time", side_effect=[1000.1, 1000.9, 1001.2]):
+        first = social_server._cached_now_iso()
+        assert social_server._cached_now_iso() is first
+        assert social_server._cached_now_iso() != first
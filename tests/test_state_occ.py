@@ -3,6 +3,7 @@ Tests for Optimistic Concurrency Control (OCC) in GlobalState.
 
 Verifies that state version conflicts are detected and handled correctly.
 """
+import pytest
 from chimera.core.state import StateManager
 
 
@@ -64,3 +65,83 @@ def test_budget_limit_check():
     
     is_allowed, current = manager.check_budget_limit("USDC", 30.0)  # Would exceed limit (30+30=60 > 50)
     assert is_allowed is False
+
+
+def test_redis_backed_budget_update():
+    """
+    Verifies that Redis-backed budget updates run the atomic script against real limits.
+    """
+    import fakeredis
+    from chimera.core.state import BUDGET_SPEND_KEY
+    
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    manager = StateManager(redis_client=redis_client)
+    version_before = manager.get_state_snapshot().state_version.version_hash
+    
+    assert manager.set_budget_limit("USDC", 50.0, "system") is True
+    assert manager.update_budget("USDC", 30.0, "agent_a") is True
+    assert manager.update_budget("USDC", 30.0, "agent_a") is False  # Rejected by limit
+    assert manager.update_budget("ETH", 1000.0, "agent_a") is True  # No limit set
+    
+    assert float(redis_client.hget(BUDGET_SPEND_KEY, "USDC")) == 30.0
+    # No OCC commit happened
+    assert manager.get_state_snapshot().state_version.version_hash == version_before
+    
+    assert manager.check_budget_limit("USDC", 30.0) == (False, 30.0)
+    assert manager.check_budget_limit("USDC", 20.0) == (True, 30.0)
+
+
+def test_set_budget_limit_without_redis():
+    """
+    Verifies that limits set through the manager are enforced from GlobalState.
+    """
+    manager = StateManager()
+    
+    assert manager.set_budget_limit("USDC", 50.0, "system") is True
+    assert manager.get_state_readonly()["budget_limits"]["USDC"] == 50.0
+    assert manager.check_budget_limit("USDC", 60.0) == (False, 0.0)
+
+
+def test_readonly_state_is_shared_frozen_and_survives_commits():
+    """
+    Verifies that read-only access returns one shared, immutable view per
+    version, and that a held view is not changed by later commits.
+    """
+    manager = StateManager()
+    manager.add_campaign("campaign-0", {"goal": "Existing"}, "agent_a")
+    
+    view = manager.get_state_readonly()
+    assert view is manager.get_state_readonly()
+    old_hash = view["state_version"]["version_hash"]
+    
+    with pytest.raises(TypeError):
+        view["active_campaigns"]["campaign-1"] = {"goal": "Sneaky"}
+    with pytest.raises(TypeError):
+        view["active_campaigns"]["campaign-0"]["goal"] = "Sneaky"
+    
+    snapshot = manager.get_state_snapshot()
+    snapshot.active_campaigns["campaign-1"] = {"goal": "Test"}
+    assert manager.commit_state_change(snapshot, "agent_a", old_hash) is True
+    
+    assert "campaign-1" not in view["active_campaigns"]
+    assert view["state_version"]["version_hash"] == old_hash
+    assert "campaign-1" in manager.get_state_readonly()["active_campaigns"]
+    assert manager.get_state_readonly()["active_campaigns"]["campaign-0"]["goal"] == "Existing"
+
+
+def test_commit_serializes_state_once():
+    """
+    Verifies that a commit hashes the new state with a single serialization.
+    """
+    from unittest.mock import patch
+    from chimera.core.state import GlobalState
+    
+    manager = StateManager()
+    snapshot = manager.get_state_snapshot()
+    snapshot.active_campaigns["campaign-1"] = {"goal": "Test"}
+    
+    with patch.object(GlobalState, "serialize", autospec=True, side_effect=GlobalState.serialize) as mock_serialize:
+        assert manager.commit_state_change(snapshot, "agent_a", snapshot.state_version.version_hash) is True
+    
+    assert mock_serialize.call_count == 1
+    assert manager.get_state_readonly()["state_version"]["version_hash"] == snapshot.compute_hash()
@@ -36,6 +36,12 @@ def test_semantic_filter_relevance_scoring():
     )
     assert 0.0 <= score_low <= 1.0
     assert score_high > score_low
+    
+    # Repeated pairs are served from the cache with an identical score
+    assert filter_obj.score_relevance(
+        "Check out the latest summer fashion trends!",
+        agent_goals
+    ) == score_high
 
 
 def test_semantic_filter_trigger_logic():
@@ -75,3 +81,28 @@ def test_trend_detector_clustering():
     ai_trend = next((t for t in trends if t["topic"] == "AI Agents"), None)
     assert ai_trend is not None
     assert ai_trend["cluster_size"] >= 3
+
+
+def test_trend_detector_vec_matches_row_path():
+    """
+    Tests that the column-oriented path detects the same clusters as analyze_trends.
+    """
+    detector = TrendDetector(time_window_hours=4)
+    
+    topics = ["AI Agents", "AI Agents", "Crypto", "AI Agents"]
+    volumes = [1000, 1500, 500, 1200]
+    sentiment_scores = [0.8, 0.9, 0.5, 0.85]
+    
+    trends = detector.analyze_trends_vec(topics, volumes, sentiment_scores)
+    expected = detector.analyze_trends([
+        {"topic": t, "volume": v, "sentiment_score": s}
+        for t, v, s in zip(topics, volumes, sentiment_scores)
+    ])
+    
+    assert len(trends) == 1
+    assert trends[0]["topic"] == "AI Agents"
+    assert trends[0]["cluster_size"] == 3
+    assert trends[0]["total_volume"] == 3700
+    for key in ("topic", "cluster_size", "total_volume"):
+        assert trends[0][key] == expected[0][key]
+    assert abs(trends[0]["avg_sentiment"] - expected[0]["avg_sentiment"]) < 1e-9
@@ -0,0 +1,82 @@
+"""
+Tests for Character Consistency Validation.
+
+Verifies that repeated comparisons are served from the result cache.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+from chimera.core import validation
+from chimera.core.validation import CharacterConsistencyValidator, ValidationError
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    validation._result_cache.clear()
+    yield
+    validation._result_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_validation_is_memoized():
+    """Identical comparisons should only hit the Vision API once."""
+    validator = CharacterConsistencyValidator()
+
+    with patch.object(validator, "_compare_images", AsyncMock(return_value=True)) as mock_compare:
+        assert await validator.validate_image_consistency("gen.png", "ref.png", "zara") is True
+        assert await validator.validate_image_consistency("gen.png", "ref.png", "zara") is True
+
+    assert mock_compare.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_mismatch_still_raises():
+    """A cached negative result must keep failing validation."""
+    validator = CharacterConsistencyValidator()
+
+    with patch.object(validator, "_compare_images", AsyncMock(return_value=False)) as mock_compare:
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="does not match"):
+                await validator.validate_image_consistency("gen.png", "ref.png", "zara")
+
+    assert mock_compare.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_survives_process_cache_loss():
+    """Results persisted to Redis should be reused after the in-process cache is cleared."""
+    redis_client = AsyncMock()
+    redis_client.get.return_value = None
+    validator = CharacterConsistencyValidator(redis_client=redis_client)
+
+    with patch.object(validator, "_compare_images", AsyncMock(return_value=True)) as mock_compare:
+        await validator.validate_image_consistency("gen.png", "ref.png", "zara")
+        key, value = redis_client.set.await_args.args
+        assert key.startswith("validator:")
+        assert value == b"1"
+        assert redis_client.set.await_args.kwargs["ex"] == validation.RESULT_CACHE_TTL_SECONDS
+
+        validation._result_cache.clear()
+        redis_client.get.return_value = b"1"
+        assert await validator.validate_image_consistency("gen.png", "ref.png", "zara") is True
+
+    assert mock_compare.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_scoped_to_vision_model():
+    """Switching vision models must not reuse another model's verdict."""
+    gemini = CharacterConsistencyValidator(vision_model="gemini")
+    gpt4o = CharacterConsistencyValidator(vision_model="gpt4o")
+
+    with patch.object(gemini, "_compare_images", AsyncMock(return_value=True)), \
+         patch.object(gpt4o, "_compare_images", AsyncMock(return_value=False)) as mock_gpt4o:
+        assert await gemini.validate_image_consistency("gen.png", "ref.png", "zara") is True
+        with pytest.raises(ValidationError, match="does not match"):
+            await gpt4o.validate_image_consistency("gen.png", "ref.png", "zara")
+
+    assert mock_gpt4o.await_count == 1
+
+
+def test_process_cache_expires_with_redis_tier():
+    """The in-process tier uses the same expiry as the Redis tier."""
+    assert validation._result_cache.ttl == validation.RESULT_CACHE_TTL_SECONDS
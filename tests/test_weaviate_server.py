@@ -0,0 +1,233 @@
+"""
+Tests for the Weaviate MCP server.
+
+Verifies search result caching and invalidation without a live Weaviate instance.
+"""
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from chimera.core.cache import LRUCache
+from chimera.core.memory import Memory, MemoryManager
+from chimera.mcp.servers import weaviate_server
+from chimera.mcp.servers.weaviate_server import (
+    assemble_context, get_recent_memories_page, search_memory, store_memory
+)
+
+
+@pytest.fixture
+def mock_manager():
+    """Patches the server's MemoryManager and starts with an empty cache."""
+    manager = MagicMock()
+    manager.search_memories_iter.return_value = [
+        Memory(content="Loved the neon cafe shoot", agent_id="zara", timestamp=datetime(2025, 1, 1))
+    ]
+    manager.store_memory.return_value = "uuid-1"
+    with patch.object(weaviate_server, "get_memory_manager", return_value=manager), \
+         patch.object(weaviate_server, "_search_cache", LRUCache(maxsize=8, ttl=300)), \
+         patch.object(weaviate_server, "_context_cache", LRUCache(maxsize=8, ttl=60)):
+        yield manager
+
+
+def test_normalized_queries_hit_cache(mock_manager):
+    """Case, punctuation and spacing variants reuse the first search; reorderings do not."""
+    first = search_memory("zara", "Neon cafe shoot")
+    second = search_memory("zara", "  neon CAFE shoot! ")
+
+    assert first == second
+    assert mock_manager.search_memories_iter.call_count == 1
+
+    search_memory("zara", "dog bites man")
+    search_memory("zara", "man bites dog")
+    assert mock_manager.search_memories_iter.call_count == 3
+
+
+def test_cached_results_are_copies(mock_manager):
+    """Mutating a returned result list, or its entries, never changes the cache."""
+    first = search_memory("zara", "neon cafe")
+    expected = [dict(result) for result in first]
+    first[0]["content"] = "tampered"
+    first.append({"content": "extra"})
+
+    second = search_memory("zara", "neon cafe")
+    second.clear()
+
+    assert search_memory("zara", "neon cafe") == expected
+    assert mock_manager.search_memories_iter.call_count == 1
+
+
+def test_cache_is_scoped(mock_manager):
+    """Different agents, filters and limits never share cached results."""
+    search_memory("zara", "neon cafe")
+    search_memory("kai", "neon cafe")
+    search_memory("zara", "neon cafe", memory_type="semantic")
+    search_memory("zara", "neon cafe", limit=10)
+    search_memory("zara", "vintage denim")
+
+    assert mock_manager.search_memories_iter.call_count == 5
+
+
+def test_store_memory_invalidates_agent_cache(mock_manager):
+    """Storing a memory forces the next search for that agent to hit Weaviate."""
+    search_memory("zara", "neon cafe")
+    search_memory("kai", "neon cafe")
+    store_memory("zara", "New memory")
+    search_memory("zara", "neon cafe")
+    search_memory("kai", "neon cafe")
+
+    assert mock_manager.search_memories_iter.call_count == 3
+
+
+def test_expired_and_empty_results_are_not_served(mock_manager):
+    """Empty results are never cached and expired entries are refetched."""
+    mock_manager.search_memories_iter.return_value = []
+    search_memory("zara", "nothing here")
+    search_memory("zara", "nothing here")
+    assert mock_manager.search_memories_iter.call_count == 2
+
+    weaviate_server._search_cache.ttl = 0
+    mock_manager.search_memories_iter.return_value = [
+        Memory(content="x", agent_id="zara", timestamp=datetime(2025, 1, 1))
+    ]
+    search_memory("zara", "neon cafe")
+    search_memory("zara", "neon cafe")
+    assert mock_manager.search_memories_iter.call_count == 4
+
+
+def test_assemble_context_is_paged_and_cached(mock_manager):
+    """Long contexts are truncated with a resume offset and assembled only once."""
+    mock_manager.assemble_context.return_value = "x" * 25
+
+    first = assemble_context("zara", "cafe", max_chars=10)
+    second = assemble_context("zara", "cafe", max_chars=10, offset=20)
+
+    assert first == "x" * 10 + "\n...[truncated, call with offset=10 for more]"
+    assert second == "x" * 5
+    assert mock_manager.assemble_context.call_count == 1
+
+    store_memory("zara", "New memory")
+    assemble_context("zara", "cafe")
+    assert mock_manager.assemble_context.call_count == 2
+
+
+def test_assemble_context_does_not_cache_empty_search(mock_manager):
+    """A context without long-term memories (e.g. Weaviate down) is rebuilt next call."""
+    from chimera.core.memory import NO_LONG_TERM_MEMORIES
+    mock_manager.assemble_context.return_value = f"# Context Assembly\n{NO_LONG_TERM_MEMORIES}"
+
+    assemble_context("zara", "cafe")
+    assemble_context("zara", "cafe")
+
+    assert mock_manager.assemble_context.call_count == 2
+
+
+@pytest.mark.parametrize("max_chars,offset", [(0, 0), (-5, 0), (10, -1)])
+def test_assemble_context_rejects_invalid_paging(mock_manager, max_chars, offset):
+    """Non-positive page sizes and negative offsets are rejected instead of looping."""
+    with pytest.raises(ValueError):
+        assemble_context("zara", "cafe", max_chars=max_chars, offset=offset)
+
+    mock_manager.assemble_context.assert_not_called()
+
+
+def test_recent_memories_page(mock_manager):
+    """Paged recent memories skip the offset and fetch only what the page needs."""
+    mock_manager.search_memories_iter.return_value = [
+        Memory(content=f"memory {i}", agent_id="zara", timestamp=datetime(2025, 1, 1)) for i in range(3)
+    ]
+
+    page = get_recent_memories_page("zara", limit=2, offset=1)
+
+    assert page == "- memory 1...\n- memory 2..."
+    assert mock_manager.search_memories_iter.call_args.kwargs["limit"] == 3
+    assert get_recent_memories_page("zara", limit=2, offset=3) == "(no recent memories)"
+
+
+@pytest.mark.parametrize("limit,offset", [(0, 0), (-2, 0), (2, -1)])
+def test_recent_memories_page_rejects_invalid_paging(mock_manager, limit, offset):
+    """Non-positive limits and negative offsets are rejected before reaching Weaviate."""
+    with pytest.raises(ValueError):
+        get_recent_memories_page("zara", limit=limit, offset=offset)
+
+    mock_manager.search_memories_iter.assert_not_called()
+
+
+def test_search_limit_is_bounded(mock_manager):
+    """Oversized limits are clamped before reaching Weaviate."""
+    search_memory("zara", "neon cafe", limit=10_000)
+    get_recent_memories_page("zara", limit=10_000, offset=0)
+
+    for call in mock_manager.search_memories_iter.call_args_list:
+        assert call.kwargs["limit"] == weaviate_server.MAX_RESULTS
+
+
+def test_search_memories_iter_yields_lazily():
+    """Results are converted one at a time, skipping low-importance objects."""
+    def weaviate_object(content, importance):
+        return SimpleNamespace(properties={
+            "content": content,
+            "agent_id": "zara",
+            "timestamp": "2025-01-01T00:00:00",
+            "importance_score": importance,
+        })
+
+    manager = MemoryManager.__new__(MemoryManager)
+    manager.client = MagicMock()
+    manager.client.collections.get.return_value.query.near_text.return_value = SimpleNamespace(
+        objects=[weaviate_object("low", 0.1), weaviate_object("high", 0.9), weaviate_object("also high", 0.8)]
+    )
+
+    memories = manager.search_memories_iter("cafe", "zara", limit=3, min_importance=0.5)
+
+    assert next(memories).content == "high"
+    assert [m.content for m in memories] == ["also high"]
+    assert [m.content for m in manager.search_memories("cafe", "zara", min_importance=0.5)] == ["high", "also high"]
+
+
+def test_memory_manager_singleton_and_reset():
+    """Concurrent first calls share one manager, and reset closes its client."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with patch.object(weaviate_server, "MemoryManager", side_effect=lambda **kwargs: MagicMock()) as MockManager, \
+         patch.object(weaviate_server, "_memory_manager", None):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            managers = list(pool.map(lambda _: weaviate_server.get_memory_manager(), range(8)))
+
+        assert all(m is managers[0] for m in managers)
+        assert MockManager.call_count == 1
+
+        weaviate_server.reset_memory_manager()
+        managers[0].client.close.assert_called_once()
+        assert weaviate_server.get_memory_manager() is not managers[0]
+        assert MockManager.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_and_keeps_shared_manager_open():
+    """Session startup runs a warm-up search; session end leaves the shared client open."""
+    manager = MagicMock()
+    with patch.object(weaviate_server, "MemoryManager", return_value=manager), \
+         patch.object(weaviate_server, "_memory_manager", None):
+        async with weaviate_server.lifespan(weaviate_server.mcp):
+            # A second, overlapping session (SSE/HTTP) ends first
+            async with weaviate_server.lifespan(weaviate_server.mcp):
+                pass
+            assert weaviate_server._memory_manager is manager
+
+        assert weaviate_server._memory_manager is manager
+
+    manager.search_memories.assert_called()
+    manager.client.close.assert_not_called()
+
+
+def test_main_closes_manager_at_shutdown():
+    """The process-wide client is closed once the server stops running."""
+    manager = MagicMock()
+    with patch.object(weaviate_server, "MemoryManager", return_value=manager), \
+         patch.object(weaviate_server, "_memory_manager", None), \
+         patch.object(weaviate_server.mcp, "run", side_effect=lambda: weaviate_server.get_memory_manager()):
+        weaviate_server.main()
+
+        assert weaviate_server._memory_manager is None
+
+    manager.client.close.assert_called_once()